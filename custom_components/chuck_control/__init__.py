@@ -3,22 +3,82 @@ from __future__ import annotations
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, SupportsResponse
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryNotReady,
     PlatformNotReady,
 )
-from .const import DOMAIN, PHASE_ORDER_DICT, CONF_HAVE_NET_CURRENT_SENSOR
+from .const import (
+    DOMAIN,
+    PHASE_ORDER_DICT,
+    CONF_DEADBAND_CURRENT,
+    CONF_DEADBAND_POWER,
+    CONF_DEADBAND_VOLTAGE,
+    CONF_HAVE_NET_CURRENT_SENSOR,
+    CONF_LOAD_BALANCING,
+    CONF_MAIN_FUSE_CURRENT,
+    CONF_MQTT_TOPIC,
+    CONF_SCAN_INTERVAL_ACTIVE,
+    CONF_SCAN_INTERVAL_IDLE,
+    CONF_SITE_BALANCING,
+    CONF_SITE_WEIGHT,
+    CONF_SURPLUS_POWER_ENTITY,
+    CONF_TIMEOUT_COMMAND,
+    CONF_TIMEOUT_CONNECT,
+    CONF_TIMEOUT_INFO,
+    CONF_TIMEOUT_PROBE,
+    CONF_TIMEOUT_STATUS,
+    CONF_TRANSPORT,
+    DEFAULT_MAIN_FUSE_CURRENT,
+    DEFAULT_SCAN_INTERVAL_ACTIVE,
+    DEFAULT_SCAN_INTERVAL_IDLE,
+    DEFAULT_SITE_WEIGHT,
+    DEFAULT_TIMEOUT_COMMAND,
+    DEFAULT_TIMEOUT_CONNECT,
+    DEFAULT_TIMEOUT_INFO,
+    DEFAULT_TIMEOUT_PROBE,
+    DEFAULT_TIMEOUT_STATUS,
+    TRANSPORT_POLLING,
+)
 import logging
 import asyncio
+from functools import partial
 from . import chuck_rest
+from .coordinator import ChuckDataUpdateCoordinator
+from .device_cache import ChuckDeviceCache
+from .fleet import async_get_fleet
+from .load_balancer import ChuckLoadBalancer
+from .sessions import ChuckSessionTracker, async_remove_session_log
+from .site import async_get_site
+from .statistics import ChuckEnergyStatistics
+from .surplus import ChuckSurplusController
 
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BUTTON]
+PLATFORMS: list[Platform] = [
+    Platform.SENSOR,
+    Platform.BUTTON,
+    Platform.SWITCH,
+    Platform.NUMBER,
+]
 _LOGGER = logging.getLogger(__name__)
 
+# Deadline of the initial fetch of a chargebox without cached device info.
+SETUP_TIMEOUT = 10
+
+GET_SESSIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("start"): cv.datetime,
+        vol.Optional("end"): cv.datetime,
+        vol.Optional("connector_id"): cv.positive_int,
+        vol.Optional("auth_tag"): cv.string,
+        vol.Optional("limit"): cv.positive_int,
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Chuck Charger Control from a config entry."""
@@ -37,32 +97,151 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             chargebox_cfg["cfg_phase_order_conn1"],
             chargebox_cfg["cfg_phase_order_conn2"],
         ],
+        transport=chuck_rest.create_transport(
+            chargebox_cfg.get(CONF_TRANSPORT, TRANSPORT_POLLING),
+            chargebox_cfg.get(CONF_MQTT_TOPIC),
+        ),
+        timeouts=chuck_rest.make_timeouts(
+            chargebox_cfg.get(CONF_TIMEOUT_CONNECT, DEFAULT_TIMEOUT_CONNECT),
+            {
+                chuck_rest.TIMEOUT_STATUS: chargebox_cfg.get(
+                    CONF_TIMEOUT_STATUS, DEFAULT_TIMEOUT_STATUS
+                ),
+                chuck_rest.TIMEOUT_INFO: chargebox_cfg.get(
+                    CONF_TIMEOUT_INFO, DEFAULT_TIMEOUT_INFO
+                ),
+                chuck_rest.TIMEOUT_COMMAND: chargebox_cfg.get(
+                    CONF_TIMEOUT_COMMAND, DEFAULT_TIMEOUT_COMMAND
+                ),
+                chuck_rest.TIMEOUT_PROBE: chargebox_cfg.get(
+                    CONF_TIMEOUT_PROBE, DEFAULT_TIMEOUT_PROBE
+                ),
+            },
+        ),
+    )
+
+    fleet = async_get_fleet(hass)
+    device_cache = ChuckDeviceCache(hass, entry.entry_id, chargebox_cfg["base_url"])
+    coordinator = ChuckDataUpdateCoordinator(
+        hass,
+        chargebox,
+        fleet,
+        entry.entry_id,
+        active_interval=chargebox_cfg.get(
+            CONF_SCAN_INTERVAL_ACTIVE, DEFAULT_SCAN_INTERVAL_ACTIVE
+        ),
+        idle_interval=chargebox_cfg.get(
+            CONF_SCAN_INTERVAL_IDLE, DEFAULT_SCAN_INTERVAL_IDLE
+        ),
+        deadbands={
+            option: chargebox_cfg.get(option, 0)
+            for option in (
+                CONF_DEADBAND_CURRENT,
+                CONF_DEADBAND_VOLTAGE,
+                CONF_DEADBAND_POWER,
+            )
+        },
     )
 
-    try:
-        await hass.async_add_executor_job(chargebox.update)
-    except chuck_rest.ChuckRestTimeout:
-        raise ConfigEntryNotReady(
-            f"Could not connect to chargebox {
-                chargebox_cfg['friendly_name']} at {chargebox_cfg['base_url']}"
+    if (cached := await device_cache.async_load()) is not None:
+        # Register the entities from the cached device info right away, the
+        # status is fetched in the background and marks them available.
+        chargebox.restore_device_info(cached["info"], cached["connectors_count"])
+        coordinator.last_update_success = False
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {entry.title}"
         )
-    except chuck_rest.ChuckAuthError:
-        raise ConfigEntryAuthFailed(
-            f"Wrong username or password supplied for chargebox {
-                chargebox_cfg['friendly_name']} at {chargebox_cfg['base_url']}"
+    else:
+        try:
+            async with asyncio.timeout(SETUP_TIMEOUT):
+                async with fleet.fetch_slot(entry.entry_id):
+                    await chargebox.update()
+        except (chuck_rest.ChuckRestTimeout, TimeoutError):
+            await chargebox.close()
+            raise ConfigEntryNotReady(
+                f"Could not connect to chargebox {
+                    chargebox_cfg['friendly_name']} at {chargebox_cfg['base_url']}"
+            )
+        except chuck_rest.ChuckAuthError:
+            await chargebox.close()
+            raise ConfigEntryAuthFailed(
+                f"Wrong username or password supplied for chargebox {
+                    chargebox_cfg['friendly_name']} at {chargebox_cfg['base_url']}"
+            )
+        except:
+            await chargebox.close()
+            raise ConfigEntryNotReady(
+                f"Unknown error connecting to chargebox {
+                    chargebox_cfg['friendly_name']} at {chargebox_cfg['base_url']}"
+            )
+        coordinator.async_set_updated_data(chargebox.status)
+
+    chargebox_cfg["unsub_device_cache_listener"] = coordinator.async_add_listener(
+        lambda: device_cache.async_schedule_save(chargebox)
+    )
+    device_cache.async_schedule_save(chargebox)
+    fleet.async_add(entry.entry_id, coordinator)
+
+    load_balancer = None
+    if chargebox_cfg.get(CONF_SITE_BALANCING):
+        # The site balancer sets the limits of this chargebox, not its own balancer.
+        async_get_site(hass).async_add(
+            entry.entry_id,
+            coordinator,
+            chargebox_cfg.get(CONF_MAIN_FUSE_CURRENT, DEFAULT_MAIN_FUSE_CURRENT),
+            chargebox_cfg.get(CONF_SITE_WEIGHT, DEFAULT_SITE_WEIGHT),
         )
-    except:
-        raise ConfigEntryNotReady(
-            f"Unknown error connecting to chargebox {
-                chargebox_cfg['friendly_name']} at {chargebox_cfg['base_url']}"
+    elif have_net_current_sensor and chargebox_cfg.get(CONF_LOAD_BALANCING):
+        load_balancer = ChuckLoadBalancer(
+            hass,
+            coordinator,
+            chargebox_cfg.get(CONF_MAIN_FUSE_CURRENT, DEFAULT_MAIN_FUSE_CURRENT),
         )
+        chargebox_cfg["unsub_load_balancer"] = load_balancer.async_start()
+
+    energy_statistics = ChuckEnergyStatistics(hass, coordinator)
+    chargebox_cfg["unsub_energy_statistics"] = energy_statistics.async_start()
+
+    session_tracker = ChuckSessionTracker(hass, coordinator, entry.entry_id)
+    chargebox_cfg["unsub_session_tracker"] = await session_tracker.async_start()
+
+    surplus = {}
+    if power_entity_id := chargebox_cfg.get(CONF_SURPLUS_POWER_ENTITY):
+        balanced = load_balancer is not None or chargebox_cfg.get(CONF_SITE_BALANCING)
+        surplus = {
+            connector_id: ChuckSurplusController(
+                hass,
+                coordinator,
+                connector_id,
+                power_entity_id,
+                write_limits=not balanced,
+            )
+            for connector_id in range(1, chargebox.get_connectors_count() + 1)
+        }
+    await coordinator.async_start_transport()
 
     # Registers update listener to update config entry when options are updated.
     unsub_options_update_listener = entry.add_update_listener(
         options_update_listener)
     # Store a reference to the unsubscribe function to cleanup if an entry is unloaded.
     chargebox_cfg["unsub_options_update_listener"] = unsub_options_update_listener
-    chargebox_cfg.update({"chargebox": chargebox})
+
+    async def close_chargebox_session(_) -> None:
+        await chargebox.close()
+
+    chargebox_cfg["unsub_stop_listener"] = hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_STOP, close_chargebox_session
+    )
+    chargebox_cfg.update(
+        {
+            "chargebox": chargebox,
+            "coordinator": coordinator,
+            "load_balancer": load_balancer,
+            "surplus": surplus,
+            "energy_statistics": energy_statistics,
+            "sessions": session_tracker,
+        }
+    )
     hass.data[DOMAIN][entry.entry_id] = chargebox_cfg
 
     hass.services.async_register(
@@ -71,6 +250,37 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         lambda _: entry.as_dict(),
         supports_response=SupportsResponse.ONLY,
     )
+    hass.services.async_register(
+        DOMAIN,
+        "get_pool_stats",
+        lambda call: get_pool_stats(hass, call),
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "get_command_stats",
+        lambda call: get_command_stats(hass, call),
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "get_site_stats",
+        lambda _: async_get_site(hass).get_stats(),
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "get_fleet_stats",
+        lambda _: fleet.get_stats(),
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "get_sessions",
+        partial(async_get_sessions, hass),
+        schema=GET_SESSIONS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -81,11 +291,72 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN][entry.entry_id]["unsub_options_update_listener"]()
+        hass.data[DOMAIN][entry.entry_id]["unsub_stop_listener"]()
+        hass.data[DOMAIN][entry.entry_id]["unsub_device_cache_listener"]()
+        hass.data[DOMAIN][entry.entry_id]["unsub_energy_statistics"]()
+        hass.data[DOMAIN][entry.entry_id]["unsub_session_tracker"]()
+        if "unsub_load_balancer" in hass.data[DOMAIN][entry.entry_id]:
+            hass.data[DOMAIN][entry.entry_id]["unsub_load_balancer"]()
+        for controller in hass.data[DOMAIN][entry.entry_id]["surplus"].values():
+            controller.async_shutdown()
+        await hass.data[DOMAIN][entry.entry_id]["coordinator"].commands.async_shutdown()
+        await hass.data[DOMAIN][entry.entry_id]["chargebox"].close()
+        async_get_fleet(hass).async_remove(entry.entry_id)
+        async_get_site(hass).async_remove(entry.entry_id)
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the cached device info and the session log of a removed config entry."""
+    await ChuckDeviceCache(
+        hass, entry.entry_id, entry.options.get("base_url")
+    ).async_remove()
+    await async_remove_session_log(hass, entry.entry_id)
+
+
+def get_pool_stats(hass: HomeAssistant, call: ServiceCall) -> dict:
+    """Return HTTP connection pool statistics of every configured chargebox."""
+    return {
+        entry_id: {
+            "friendly_name": chargebox_cfg["friendly_name"],
+            **chargebox_cfg["chargebox"].get_pool_stats(),
+        }
+        for entry_id, chargebox_cfg in hass.data[DOMAIN].items()
+    }
+
+
+def get_command_stats(hass: HomeAssistant, call: ServiceCall) -> dict:
+    """Return command queue depth, outcomes and latency of every configured chargebox."""
+    return {
+        entry_id: {
+            "friendly_name": chargebox_cfg["friendly_name"],
+            **chargebox_cfg["coordinator"].commands.get_stats(),
+        }
+        for entry_id, chargebox_cfg in hass.data[DOMAIN].items()
+    }
+
+
+async def async_get_sessions(hass: HomeAssistant, call: ServiceCall) -> dict:
+    """Return the logged charging sessions of every configured chargebox."""
+    start = call.data.get("start")
+    end = call.data.get("end")
+    return {
+        entry_id: {
+            "friendly_name": chargebox_cfg["friendly_name"],
+            "sessions": await chargebox_cfg["sessions"].async_query(
+                start=dt_util.as_utc(start) if start else None,
+                end=dt_util.as_utc(end) if end else None,
+                connector_id=call.data.get("connector_id"),
+                auth_tag=call.data.get("auth_tag"),
+                limit=call.data.get("limit"),
+            ),
+        }
+        for entry_id, chargebox_cfg in hass.data[DOMAIN].items()
+    }
+
+
 async def options_update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
     """Handle options update."""
     await hass.config_entries.async_reload(config_entry.entry_id)
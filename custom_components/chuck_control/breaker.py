@@ -0,0 +1,84 @@
+"""Circuit breaker for unreachable chargeboxes of the Chuck Charger Control integration."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+# Consecutive failed updates after which a chargebox is only probed.
+FAILURE_THRESHOLD = 3
+# First and longest wait between two probes, in seconds.
+BACKOFF_MIN = 10
+BACKOFF_MAX = 300
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+
+
+class ChuckCircuitBreaker:
+    """Count consecutive failures of a chargebox and space out retries once it seems gone.
+
+    Closed, every update polls the chargebox as usual. After FAILURE_THRESHOLD
+    failures in a row the breaker opens: updates only probe the chargebox, with
+    the wait between probes doubling from BACKOFF_MIN up to BACKOFF_MAX. The
+    first successful update closes it again.
+    """
+
+    def __init__(
+        self,
+        threshold: int = FAILURE_THRESHOLD,
+        backoff_min: float = BACKOFF_MIN,
+        backoff_max: float = BACKOFF_MAX,
+    ) -> None:
+        self.threshold = threshold
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.backoff = backoff_min
+        self.opened_at: float | None = None
+        self.trips = 0
+        self.probes = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == STATE_OPEN
+
+    def record_failure(self) -> bool:
+        """Count a failed update, return True if this one opened the breaker."""
+        self.failures += 1
+        if self.is_open:
+            self.probes += 1
+            self.backoff = min(self.backoff * 2, self.backoff_max)
+            return False
+        if self.failures < self.threshold:
+            return False
+        self.state = STATE_OPEN
+        self.opened_at = time.monotonic()
+        self.backoff = self.backoff_min
+        self.trips += 1
+        return True
+
+    def record_success(self) -> bool:
+        """Reset the failure count, return True if this closed the breaker."""
+        was_open = self.is_open
+        if was_open:
+            self.probes += 1
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.backoff = self.backoff_min
+        return was_open
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "backoff": self.backoff if self.is_open else None,
+            "open_for": (
+                None
+                if self.opened_at is None
+                else round(time.monotonic() - self.opened_at)
+            ),
+            "trips": self.trips,
+            "probes": self.probes,
+        }
@@ -4,14 +4,13 @@ from homeassistant.components.button import ButtonEntity, ButtonDeviceClass
 from homeassistant.const import *
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from datetime import timedelta
 import logging
 from .const import DOMAIN, PHASE_ORDER_DICT
 from .sensor import get_friendly_name
 
 _LOGGER = logging.getLogger(__name__)
-SCAN_INTERVAL = timedelta(seconds=2)
 
 
 async def async_setup_entry(
@@ -20,17 +19,17 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ):
     _LOGGER.debug("ASYNC SETUP ENTRY")
-    chargebox = hass.data[DOMAIN][config_entry.entry_id]["chargebox"]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     charger_connected_to_ocpp = config_entry.data.get("is_connected_to_ocpp")
-    to_add = get_buttons_to_add(chargebox, charger_connected_to_ocpp)
+    to_add = get_buttons_to_add(coordinator, charger_connected_to_ocpp)
     async_add_entities(to_add)
 
 
-def get_buttons_to_add(chargebox, charger_connected_to_ocpp) -> list[ButtonEntity]:
+def get_buttons_to_add(coordinator, charger_connected_to_ocpp) -> list[ButtonEntity]:
     """Return HA button entities used to control the charger based on its configuration.
 
     Args:
-        chargebox (ChuckChargeBox): Charger that is currently being added
+        coordinator (ChuckDataUpdateCoordinator): Coordinator of the charger that is currently being added
         charger_connected_to_ocpp (bool): True if charger is configured to communicate with a OCPP server (more on that below)
 
     Returns:
@@ -44,32 +43,32 @@ def get_buttons_to_add(chargebox, charger_connected_to_ocpp) -> list[ButtonEntit
     by the server.
     """
     buttons_to_add = []
-    for connector in range(chargebox.get_connectors_count()):
+    for connector in range(coordinator.chargebox.get_connectors_count()):
         if charger_connected_to_ocpp:
             buttons_to_add.append(
-                StartTransactionButton(chargebox=chargebox, connector_id=connector + 1)
+                StartTransactionButton(coordinator=coordinator, connector_id=connector + 1)
             )
 
         buttons_to_add.extend(
             [
-                EnableChargingButton(chargebox=chargebox, connector_id=connector + 1),
-                DisableChargingButton(chargebox=chargebox, connector_id=connector + 1),
+                EnableChargingButton(coordinator=coordinator, connector_id=connector + 1),
+                DisableChargingButton(coordinator=coordinator, connector_id=connector + 1),
             ]
         )
     return buttons_to_add
 
 
-class DisableChargingButton(ButtonEntity):
-    def __init__(self, chargebox, connector_id) -> None:
-        super().__init__()
-        self.chargebox = chargebox
+class DisableChargingButton(CoordinatorEntity, ButtonEntity):
+    def __init__(self, coordinator, connector_id) -> None:
+        super().__init__(coordinator)
+        self.chargebox = coordinator.chargebox
         self.connector_id = connector_id
         self.friendly_name_appendix = "Disable charging"
         self.friendly_name = get_friendly_name(self)
 
     async def async_press(self):
-        await self.chargebox.set_connector_enable_charging(
-            connectorId=self.connector_id, state=False
+        await self.coordinator.commands.async_set_enable_charging(
+            self.connector_id, False
         )
 
     @property
@@ -85,17 +84,17 @@ class DisableChargingButton(ButtonEntity):
         return self.chargebox.get_device_info()
 
 
-class EnableChargingButton(ButtonEntity):
-    def __init__(self, chargebox, connector_id) -> None:
-        super().__init__()
-        self.chargebox = chargebox
+class EnableChargingButton(CoordinatorEntity, ButtonEntity):
+    def __init__(self, coordinator, connector_id) -> None:
+        super().__init__(coordinator)
+        self.chargebox = coordinator.chargebox
         self.connector_id = connector_id
         self.friendly_name_appendix = "Enable charging"
         self.friendly_name = get_friendly_name(self)
 
     async def async_press(self):
-        await self.chargebox.set_connector_enable_charging(
-            connectorId=self.connector_id, state=True
+        await self.coordinator.commands.async_set_enable_charging(
+            self.connector_id, True
         )
 
     @property
@@ -111,17 +110,17 @@ class EnableChargingButton(ButtonEntity):
         return self.chargebox.get_device_info()
 
 
-class StartTransactionButton(ButtonEntity):
-    def __init__(self, chargebox, connector_id) -> None:
-        super().__init__()
-        self.chargebox = chargebox
+class StartTransactionButton(CoordinatorEntity, ButtonEntity):
+    def __init__(self, coordinator, connector_id) -> None:
+        super().__init__(coordinator)
+        self.chargebox = coordinator.chargebox
         self.connector_id = connector_id
         self.friendly_name_appendix = "Start transcation"
         self.friendly_name = get_friendly_name(self)
 
     async def async_press(self):
-        await self.chargebox.set_connector_charging_start(
-            action="Start", connector=self.connector_id
+        await self.coordinator.commands.async_start_transaction(
+            self.connector_id, "Start"
         )
 
     @property
@@ -1,18 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
 import json
+import logging
+import time
 
-from . import DOMAIN
-from .const import PHASE_ORDER_DICT, PHASE_ORDER_DICT_DEFAULT_CFG, PHASE_ORDER
+import aiohttp
 
-import requests
-from requests.auth import HTTPBasicAuth
-import logging
-from homeassistant.core import HomeAssistant
+from . import DOMAIN
+from .const import (
+    DEFAULT_TIMEOUT_COMMAND,
+    DEFAULT_TIMEOUT_CONNECT,
+    DEFAULT_TIMEOUT_INFO,
+    DEFAULT_TIMEOUT_PROBE,
+    DEFAULT_TIMEOUT_STATUS,
+    PHASE_ORDER_DICT,
+    PHASE_ORDER_DICT_DEFAULT_CFG,
+    PHASE_ORDER,
+    TRANSPORT_MQTT,
+    TRANSPORT_POLLING,
+    TRANSPORT_STREAM,
+)
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import (
+    async_create_clientsession,
+    async_get_clientsession,
+)
+from homeassistant.util import dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_BASE_URL = "http://localhost/"
 DEFAULT_AUTH_NAME = "admin"
 DEFAULT_AUTH_PASS = "admin"
+# Endpoint classes with their own read timeout.
+TIMEOUT_STATUS = "status"
+TIMEOUT_INFO = "info"
+TIMEOUT_COMMAND = "command"
+# Probes of an unreachable chargebox give up early, a live one answers /api/status fast.
+TIMEOUT_PROBE = "probe"
+DEFAULT_READ_TIMEOUTS = {
+    TIMEOUT_STATUS: DEFAULT_TIMEOUT_STATUS,
+    TIMEOUT_INFO: DEFAULT_TIMEOUT_INFO,
+    TIMEOUT_COMMAND: DEFAULT_TIMEOUT_COMMAND,
+    TIMEOUT_PROBE: DEFAULT_TIMEOUT_PROBE,
+}
+# One connection for polling plus one for a command sent in between is all a
+# chargebox web server needs; anything more only adds sockets on the device.
+POOL_SIZE = 2
+# /automation/info only changes when the unit config is written, see invalidate_info()
+INFO_REFRESH_INTERVAL = 600
+# Server-sent events endpoint pushing a full /automation/status body per event.
+STREAM_PATH = "/api/admin/automation/status/stream"
+# A stream without any event or keep-alive comment for this long is reconnected.
+STREAM_READ_TIMEOUT = 60
+STREAM_RETRY_MIN = 1
+STREAM_RETRY_MAX = 60
+# Answers of firmware without the stream endpoint, others are retried.
+STREAM_UNSUPPORTED_STATUS = (404, 405)
+# Latencies kept per endpoint for the rolling percentiles.
+LATENCY_WINDOW = 200
+# Upper bounds in seconds of the latency histogram buckets, the last one is open.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def make_timeouts(
+    connect: float = DEFAULT_TIMEOUT_CONNECT,
+    read: dict[str, float] | None = None,
+) -> dict[str, aiohttp.ClientTimeout]:
+    """Return the request timeout of every endpoint class.
+
+    A request may take connect seconds to open its socket and then wait up to
+    the read timeout of its class for every chunk, never more than both together.
+    """
+    read = {**DEFAULT_READ_TIMEOUTS, **(read or {})}
+    return {
+        endpoint: aiohttp.ClientTimeout(
+            total=connect + seconds, sock_connect=connect, sock_read=seconds
+        )
+        for endpoint, seconds in read.items()
+    }
 
 
 async def test_connection(
@@ -23,28 +94,182 @@ async def test_connection(
     url = baseurl + "/api/admin/automation/status"
 
     _LOGGER.debug(f"request to {url}")
-    timeout = 60
+    session = async_get_clientsession(hass)
+    auth = aiohttp.BasicAuth(username, password) if username and password else None
     try:
-        if username and password:
-            response = await hass.async_add_executor_job(
-                requests.get(
-                    url,
-                    auth=HTTPBasicAuth(username, password),
-                    timeout=timeout,
-                )
-            )
-        else:
-            response = await hass.async_add_executor_job(
-                requests.get(url, timeout=timeout)
-            )
-
-    except requests.exceptions.Timeout as exception:
+        async with session.get(
+            url, auth=auth, timeout=make_timeouts()[TIMEOUT_STATUS]
+        ) as response:
+            status = response.status
+    except (asyncio.TimeoutError, aiohttp.ClientError) as exception:
         raise ChuckRestTimeout("Timeout reaching Chuck API") from exception
 
-    if response.status_code == 401:
+    if status == 401:
         raise ChuckAuthError("Wrong username or password supplied for Chuck API")
 
-    return bool(response.status_code == 200)
+    return bool(status == 200)
+
+
+class PhaseSnapshot:
+    """Current on one logical phase of a connector, physical phase order already applied."""
+
+    __slots__ = ("phase", "physical_phase", "current")
+
+    def __init__(self, phase: int, physical_phase: int, current: float) -> None:
+        self.phase = phase
+        self.physical_phase = physical_phase
+        self.current = current
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PhaseSnapshot):
+            return NotImplemented
+        return (
+            self.phase == other.phase
+            and self.physical_phase == other.physical_phase
+            and self.current == other.current
+        )
+
+
+class EndpointStats:
+    """Timing and outcome of the requests to one chargebox API endpoint.
+
+    Percentiles cover the last LATENCY_WINDOW requests, the histogram and the
+    counters everything since the integration started. Requests answered with
+    an HTTP error count as errors, ones that got no answer in time as timeouts.
+    """
+
+    __slots__ = (
+        "latencies",
+        "histogram",
+        "success",
+        "error",
+        "timeout",
+        "last_success",
+        "last_error",
+        "last_status",
+    )
+
+    def __init__(self) -> None:
+        self.latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.success = 0
+        self.error = 0
+        self.timeout = 0
+        self.last_success: datetime | None = None
+        self.last_error: str | None = None
+        self.last_status: int | None = None
+
+    def record(
+        self,
+        latency: float,
+        status: int | None = None,
+        error: str | None = None,
+        timeout: bool = False,
+    ) -> None:
+        self.latencies.append(latency)
+        bucket = 0
+        while bucket < len(LATENCY_BUCKETS) and latency > LATENCY_BUCKETS[bucket]:
+            bucket += 1
+        self.histogram[bucket] += 1
+        self.last_status = status
+        if timeout:
+            self.timeout += 1
+            self.last_error = error
+        elif status is None or status >= 400:
+            self.error += 1
+            self.last_error = error or f"HTTP {status}"
+        else:
+            self.success += 1
+            self.last_success = dt_util.utcnow()
+
+    def percentile(self, p: float) -> float | None:
+        """Return the p-th percentile (0-100) latency of the window in ms."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(int(p / 100 * len(ordered)), len(ordered) - 1)
+        return round(ordered[index] * 1000, 1)
+
+    def as_dict(self) -> dict:
+        return {
+            "success": self.success,
+            "error": self.error,
+            "timeout": self.timeout,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "histogram": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(LATENCY_BUCKETS, self.histogram)
+                },
+                "inf": self.histogram[-1],
+            },
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "last_error": self.last_error,
+            "last_status": self.last_status,
+        }
+
+
+class ConnectorSnapshot:
+    """Values of one connector parsed once from an /automation/status response."""
+
+    __slots__ = (
+        "connector_id",
+        "status",
+        "voltage",
+        "current",
+        "car_connected",
+        "total_wh",
+        "actual_wh",
+        "charging_status",
+        "lock_status",
+        "internal_temp",
+        "warnings",
+        "errors",
+        "phases",
+        "ext",
+    )
+
+    def __init__(self, connector_id: int, data: dict, phase_order: list[int]) -> None:
+        packet = data["packet"]
+        ext = packet.get("ext", {})
+        self.connector_id = connector_id
+        self.status = data["status"]
+        self.voltage = data["voltage"]
+        self.current = data["current"]
+        self.car_connected = bool(data["carConnected"])
+        self.total_wh = packet["totalWh"]
+        self.actual_wh = packet["actualWh"]
+        self.charging_status = packet["chargingStatus"]
+        self.lock_status = packet.get("lockStatus")
+        self.internal_temp = float(packet.get("internalTemperature", 0))
+        self.warnings = packet.get("warnings")
+        self.errors = packet.get("errors")
+        self.phases = tuple(
+            PhaseSnapshot(L, physical_L, float(ext.get(f"crrntl{physical_L}", 0)))
+            for L, physical_L in enumerate(phase_order, start=1)
+        )
+        self.ext = ext
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ConnectorSnapshot):
+            return NotImplemented
+        return all(
+            getattr(self, slot) == getattr(other, slot) for slot in self.__slots__
+        )
+
+    @property
+    def is_charging(self) -> bool:
+        return self.charging_status.startswith("CHARGING")
+
+    @property
+    def is_charging_enabled(self) -> bool:
+        return not self.status.startswith("Un")
+
+    @property
+    def power_kw(self) -> float:
+        return round(self.current * self.voltage / 1000, 2)
 
 
 class ChuckChargeBox:
@@ -57,15 +282,35 @@ class ChuckChargeBox:
         have_net_current_sensor=False,
         phase_order=None,
         friendly_name=None,
+        transport: ChuckTransport | None = None,
+        timeouts: dict[str, aiohttp.ClientTimeout] | None = None,
     ) -> None:
         self.hass = hass
+        self.timeouts = timeouts if timeouts is not None else make_timeouts()
+        self.session = None
+        self.closed = False
+        # HA's shared connector has no per chargebox limit, requests queue here.
+        self._request_slots = asyncio.Semaphore(POOL_SIZE)
+        self.transport = transport if transport is not None else ChuckPollingTransport()
         self.base_url = base_url
         self.auth_name = auth_name
         self.auth_pass = auth_pass
         self.friendly_name = friendly_name
         self.status = {}
+        self.connectors: dict[int, ConnectorSnapshot] = {}
+        self.connectors_count = 0
+        # connectors whose snapshot differs from the previous status response
+        self.changed_connectors: set[int] = set()
+        self._info_changed = False
+        # Validators and body of the last polled status, to skip unchanged ones.
+        self._status_etag: str | None = None
+        self._status_last_modified: str | None = None
+        self._status_body: str | None = None
+        self.status_unchanged = 0
+        self.net_currents = (0, 0, 0)
         self.basic_status = {}
         self.info = {}
+        self.info_fetched_at = None
         self.device_info = {}
 
         if phase_order is None:
@@ -78,59 +323,204 @@ class ChuckChargeBox:
 
         self.have_net_current_sensor = have_net_current_sensor
         self.initializing = True
-        self.tmp_charging_limit = [0, 0, 0, 0]
+        # None until restored from the number entity or defaulted on the first update
+        self.tmp_charging_limit = [None, None, None, None]
+        self.surplus_charging_limit: dict[int, int] = {}
+
+        if self.auth_name and self.auth_pass:
+            self.auth_headers = {
+                aiohttp.hdrs.AUTHORIZATION: aiohttp.BasicAuth(
+                    self.auth_name, self.auth_pass
+                ).encode()
+            }
+        else:
+            self.auth_headers = {}
+        self.pool_stats = {
+            "requests": 0,
+            "in_flight": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+        }
+        self.endpoint_stats: dict[str, EndpointStats] = {}
 
-    def request_data(self, url):
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the keep-alive session of this chargebox, creating it on first use."""
+        if self.closed:
+            raise ChuckRestError(
+                f"Connection to chargebox {self.get_friendly_name()} is closed"
+            )
+        if self.session is None or self.session.closed:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_start.append(self._on_request_start)
+            trace_config.on_request_end.append(self._on_request_end)
+            trace_config.on_request_exception.append(self._on_request_end)
+            trace_config.on_connection_create_end.append(self._on_connection_create)
+            trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+            # Keep-alive connections of HA's shared connector, with HA's SSL
+            # context and User-Agent; closed with HA or by close().
+            self.session = async_create_clientsession(
+                self.hass, trace_configs=[trace_config]
+            )
+        return self.session
+
+    async def close(self) -> None:
+        """Stop the status transport and close the keep-alive session for good."""
+        self.closed = True
+        await self.transport.async_stop()
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def _on_request_start(self, session, ctx, params) -> None:
+        self.pool_stats["requests"] += 1
+        self.pool_stats["in_flight"] += 1
+
+    async def _on_request_end(self, session, ctx, params) -> None:
+        self.pool_stats["in_flight"] -= 1
+
+    async def _on_connection_create(self, session, ctx, params) -> None:
+        self.pool_stats["connections_created"] += 1
+
+    async def _on_connection_reuse(self, session, ctx, params) -> None:
+        self.pool_stats["connections_reused"] += 1
+
+    def get_pool_stats(self) -> dict:
+        return {"pool_size": POOL_SIZE, **self.pool_stats}
+
+    def _record_request(
+        self,
+        url: str,
+        started_at: float,
+        status: int | None = None,
+        exception: Exception | None = None,
+    ) -> None:
+        endpoint = url.removeprefix(self.base_url)
+        if (stats := self.endpoint_stats.get(endpoint)) is None:
+            stats = self.endpoint_stats[endpoint] = EndpointStats()
+        stats.record(
+            time.monotonic() - started_at,
+            status=status,
+            error=None if exception is None else repr(exception),
+            timeout=isinstance(exception, asyncio.TimeoutError),
+        )
+
+    def get_endpoint_stats(self, endpoint: str) -> EndpointStats | None:
+        return self.endpoint_stats.get(endpoint)
+
+    def get_request_stats(self) -> dict:
+        """Return timing and outcome counters per endpoint and for the whole chargebox."""
+        endpoints = self.endpoint_stats.values()
+        last_success = max(
+            (stats.last_success for stats in endpoints if stats.last_success),
+            default=None,
+        )
+        return {
+            "success": sum(stats.success for stats in endpoints),
+            "error": sum(stats.error for stats in endpoints),
+            "timeout": sum(stats.timeout for stats in endpoints),
+            "status_unchanged": self.status_unchanged,
+            "last_success": last_success.isoformat() if last_success else None,
+            "endpoints": {
+                endpoint: stats.as_dict()
+                for endpoint, stats in self.endpoint_stats.items()
+            },
+        }
+
+    async def request_data(self, url, timeout_class=TIMEOUT_STATUS, headers=None):
         """Requests data from uri supplied"""
 
         _LOGGER.debug(f"request to {url}")
-        timeout = 60
-        try:
-            if self.auth_name and self.auth_pass:
-                response = requests.get(
+        async with self._request_slots:
+            started_at = time.monotonic()
+            try:
+                async with self._get_session().get(
                     url,
-                    auth=HTTPBasicAuth(self.auth_name, self.auth_pass),
-                    timeout=timeout,
+                    headers=(
+                        {**self.auth_headers, **headers} if headers else self.auth_headers
+                    ),
+                    timeout=self.timeouts[timeout_class],
+                ) as response:
+                    await response.read()
+            except (asyncio.TimeoutError, aiohttp.ClientError) as exception:
+                self._record_request(url, started_at, exception=exception)
+                raise ChuckRestTimeout("Timeout reaching Chuck API") from exception
+            except asyncio.CancelledError:
+                # Cut off by a shutdown or an unload of the config entry.
+                self._record_request(
+                    url, started_at, exception=asyncio.TimeoutError("cancelled")
                 )
-            else:
-                response = requests.get(url, timeout=timeout)
-        except (
-            requests.exceptions.Timeout,
-            requests.exceptions.ConnectionError,
-        ) as exception:
-            raise ChuckRestTimeout("Timeout reaching Chuck API") from exception
-
-        if response.status_code == 401:
+                raise
+            self._record_request(url, started_at, status=response.status)
+
+        if response.status == 401:
             raise ChuckAuthError("Wrong username or password supplied for Chuck API")
 
-        if response.status_code == 403:
+        if response.status == 403:
             raise ChuckRestError("REST HTTP Error 403 - forbidden")
         return response
 
-    def get_status(self):
-        response = self.request_data(f"{self.base_url}/api/admin/automation/status")
-        if response.status_code == 200:
-            self.status = response.json()
+    async def get_status(self):
+        """Fetch the status, parsing it only when it changed since the last poll.
+
+        The request is conditional when the chargebox sent an ETag or
+        Last-Modified header, otherwise the body is compared with the last one.
+        """
+        headers = {}
+        if self._status_etag is not None:
+            headers[aiohttp.hdrs.IF_NONE_MATCH] = self._status_etag
+        if self._status_last_modified is not None:
+            headers[aiohttp.hdrs.IF_MODIFIED_SINCE] = self._status_last_modified
+        response = await self.request_data(
+            f"{self.base_url}/api/admin/automation/status", TIMEOUT_STATUS, headers
+        )
+        body = await response.text() if response.status == 200 else None
+        if response.status == 304 or (body is not None and body == self._status_body):
+            self.status_unchanged += 1
+            self.changed_connectors = set(self.connectors) if self._info_changed else set()
+            self._info_changed = False
+        elif response.status == 200:
+            self.set_status(json.loads(body))
+            self._status_body = body
+            self._status_etag = response.headers.get(aiohttp.hdrs.ETAG)
+            self._status_last_modified = response.headers.get(aiohttp.hdrs.LAST_MODIFIED)
+        elif response.status >= 500:
+            raise ChuckRestError(
+                f"REST HTTP Error {response.status}", status=response.status
+            )
         else:
             _LOGGER.warning(
                 "Unsucessful request for Chuck info, response=%s to url=%s",
-                response.status_code,
+                response.status,
                 response.url,
             )
 
-    def get_basic_status(self):
-        response = self.request_data(f"{self.base_url}/api/status")
-        if response.status_code == 200:
-            self.basic_status = response.json()
+    async def get_basic_status(self, timeout_class=TIMEOUT_STATUS):
+        """Fetch /api/status, the cheapest request telling whether the chargebox is up."""
+        response = await self.request_data(f"{self.base_url}/api/status", timeout_class)
+        if response.status != 200:
+            raise ChuckRestError(
+                f"REST HTTP Error {response.status}", status=response.status
+            )
+        self.basic_status = await response.json(content_type=None)
 
-    def get_info(self):
-        response = self.request_data(f"{self.base_url}/api/admin/automation/info")
-        if response.status_code == 200:
-            self.info = response.json()
+    async def get_info(self):
+        response = await self.request_data(
+            f"{self.base_url}/api/admin/automation/info", TIMEOUT_INFO
+        )
+        if response.status == 200:
+            info = await response.json(content_type=None)
+            if info != self.info:
+                self._info_changed = True
+            self.info = info
+            self.info_fetched_at = time.monotonic()
+        elif response.status >= 500:
+            raise ChuckRestError(
+                f"REST HTTP Error {response.status}", status=response.status
+            )
         else:
             _LOGGER.warning(
                 "Unsucessful request for Chuck info, response=%s to url=%s",
-                response.status_code,
+                response.status,
                 response.url,
             )
 
@@ -141,18 +531,39 @@ class ChuckChargeBox:
             return "Chargebox"
 
     async def send_command(self, url, data, auth=True):
-        await self.hass.async_add_executor_job(self.send_post, url, data, auth)
+        return await self.send_post(url, data, auth)
 
-    def send_post(self, url, data, auth):
+    async def send_post(self, url, data, auth):
         _LOGGER.debug(f"SEND COMMAND {url}, {data}")
-        if auth:
-            _LOGGER.debug("AUTH")
-            requests.post(
-                url, json=data, auth=(self.auth_name, self.auth_pass), timeout=7
+        async with self._request_slots:
+            started_at = time.monotonic()
+            try:
+                async with self._get_session().post(
+                    url,
+                    json=data,
+                    headers=self.auth_headers if auth else None,
+                    timeout=self.timeouts[TIMEOUT_COMMAND],
+                ) as response:
+                    await response.read()
+            except (asyncio.TimeoutError, aiohttp.ClientError) as exception:
+                self._record_request(url, started_at, exception=exception)
+                raise ChuckRestTimeout("Timeout reaching Chuck API") from exception
+            except asyncio.CancelledError:
+                # Cut off by a shutdown or an unload of the config entry.
+                self._record_request(
+                    url, started_at, exception=asyncio.TimeoutError("cancelled")
+                )
+                raise
+            self._record_request(url, started_at, status=response.status)
+
+        if response.status == 401:
+            raise ChuckAuthError("Wrong username or password supplied for Chuck API")
+
+        if response.status >= 400:
+            raise ChuckRestError(
+                f"REST HTTP Error {response.status}", status=response.status
             )
-        else:
-            _LOGGER.debug("NO AUTH")
-            requests.post(url, json=data, timeout=7)
+        return response
 
     def get_device_info(self):
         info = {
@@ -163,115 +574,436 @@ class ChuckChargeBox:
         }
         return info
 
+    def set_status(self, status: dict) -> None:
+        """Store a status response and parse it into connector snapshots.
+
+        Nothing is stored when parsing fails, the last status stays in place.
+        """
+        connectors = {}
+        for connector_id, data in status["connectors"].items():
+            if int(connector_id) <= len(self.phase_order):
+                phase_order = self.phase_order[int(connector_id) - 1]
+            else:
+                phase_order = PHASE_ORDER[PHASE_ORDER_DICT_DEFAULT_CFG]
+            connectors[int(connector_id)] = ConnectorSnapshot(
+                int(connector_id), data, phase_order
+            )
+        net_currents = self.net_currents
+        if 1 in connectors:
+            ext = connectors[1].ext
+            net_currents = tuple(ext.get(f"exmcl{L}", 0) for L in (1, 2, 3))
+        all_changed = self._info_changed or status.get("authTag") != self.status.get(
+            "authTag"
+        )
+        self._info_changed = False
+        # A pushed status may differ from the last polled one, compare anew.
+        self._status_body = self._status_etag = self._status_last_modified = None
+        self.status = status
+        self.changed_connectors = {
+            connector_id
+            for connector_id, connector in connectors.items()
+            if all_changed or self.connectors.get(connector_id) != connector
+        }
+        self.connectors = connectors
+        self.connectors_count = len(connectors)
+        self.net_currents = net_currents
+
+    def get_connector(self, connector) -> ConnectorSnapshot:
+        return self.connectors[int(connector)]
+
     def get_connectors_count(self) -> int:
-        return len(self.status["connectors"])
+        return self.connectors_count
+
+    def restore_device_info(self, info: dict, connectors_count: int) -> None:
+        """Register entities from device info cached by an earlier run.
+
+        The cache may hold limits the chargebox lost in a restart since, so
+        the info stays stale and the first update() fetches it all the same.
+        """
+        self.info = info
+        self.connectors_count = connectors_count
 
     def get_connector_status(self, connector):
-        return self.status["connectors"][str(connector)]["status"]
+        return self.connectors[int(connector)].status
 
     def get_connector_total_energy(self, connector):
-        return self.status["connectors"][str(connector)]["packet"]["totalWh"]
+        return self.connectors[int(connector)].total_wh
 
     def get_connector_session_energy(self, connector):
-        return self.status["connectors"][str(connector)]["packet"]["actualWh"]
+        return self.connectors[int(connector)].actual_wh
 
     def get_phase_order_cfg(self):
         return self.phase_order
 
     def get_connector_voltage(self, connector):
-        return self.status["connectors"][str(connector)]["voltage"]
+        return self.connectors[int(connector)].voltage
 
     def get_connector_current(self, connector):
-        return self.status["connectors"][str(connector)]["current"]
+        return self.connectors[int(connector)].current
 
     def get_connector_power_kw(self, connector):
-        return round(
-            self.get_connector_current(connector)
-            * self.get_connector_voltage(connector)
-            / 1000,
-            2,
-        )
+        return self.connectors[int(connector)].power_kw
 
     def get_connector_max_charging_current(self, connector):
         return self.info["config"][f"MaxCurrent_{str(connector)}"]
 
     def get_connector_tmp_charging_limit(self, connector):
-        return self.tmp_charging_limit[int(connector) - 1]
+        limit = self.tmp_charging_limit[int(connector) - 1]
+        if limit is None:
+            # Neither restored nor defaulted by a first update() yet.
+            limit = self.info.get("config", {}).get("MaxDefaultCurrent", 0.0)
+        return limit
 
     def set_connector_tmp_charging_limit(self, connector, value):
         self.tmp_charging_limit[int(connector) - 1] = value
 
+    def set_connector_surplus_charging_limit(self, connector, value) -> None:
+        if value is None:
+            self.surplus_charging_limit.pop(int(connector), None)
+        else:
+            self.surplus_charging_limit[int(connector)] = value
+
+    def get_connector_charging_cap(self, connector) -> float:
+        """Return the most current a load balancer may give the connector."""
+        cap = self.get_connector_tmp_charging_limit(connector)
+        if (surplus := self.surplus_charging_limit.get(int(connector))) is not None:
+            cap = min(cap, surplus)
+        return cap
+
     async def set_connector_max_charging_current(self, connector, max_charging_current):
-        _LOGGER.debug(f"SEND POST TO THIS CHARGER {connector}, {max_charging_current}")
+        return await self.set_connectors_max_charging_current(
+            {int(connector): max_charging_current}
+        )
+
+    async def set_connectors_max_charging_current(
+        self, max_charging_currents: dict[int, float]
+    ) -> None:
+        """Write the max charging current of several connectors in one unitconfig POST."""
+        _LOGGER.debug(f"SEND POST TO THIS CHARGER {max_charging_currents}")
         data = {
-            "values": {f"MaxCurrent_{str(connector)}": str(max_charging_current)},
+            "values": {
+                f"MaxCurrent_{str(connector)}": str(max_charging_current)
+                for connector, max_charging_current in max_charging_currents.items()
+            },
             "persist": False,
         }
-        await self.send_command(f"{self.base_url}/api/admin/unitconfig", data)
+        response = await self.send_command(
+            f"{self.base_url}/api/admin/unitconfig", data
+        )
+        self.invalidate_info()
+        return response
 
     async def set_connector_enable_charging(self, connectorId: int, state: bool):
         _LOGGER.debug(f"Set connector {connectorId} to state {state}")
         data = {"connectorId": connectorId, "enable": state}
-        await self.send_command(f"{self.base_url}/api/status", data)
+        return await self.send_command(f"{self.base_url}/api/status", data)
 
     async def set_connector_charging_start(self, action: str, connector: int):
         data = {"action": action, "connector": connector}
-        await self.send_command(f"{self.base_url}/api/transaction", data)
+        return await self.send_command(f"{self.base_url}/api/transaction", data)
 
     def is_connector_charging_enabled(self, connectorId) -> bool:
-        return not self.status["connectors"][str(connectorId)]["status"].startswith(
-            "Un"
-        )
+        return self.connectors[int(connectorId)].is_charging_enabled
 
     def get_energy_total(self):
-        energy_total = 0
-        for c in range(0, self.get_connectors_count()):
-            energy_total += self.get_connector_total_energy(c + 1)
-        return energy_total
+        return sum(c.total_wh for c in self.connectors.values())
 
     def get_energy_session(self):
-        energy_session = 0
-        for c in range(0, self.get_connectors_count()):
-            energy_session += self.get_connector_session_energy(c + 1)
-        return energy_session
+        return sum(c.actual_wh for c in self.connectors.values())
 
     def get_current_for_connector_L(self, connector, L):
-        physical_L = self.phase_order[int(connector) - 1][L - 1]
-        return float(
-            self.status["connectors"][str(connector)]["packet"]["ext"][
-                f"crrntl{str(physical_L)}"
-            ]
-        )
+        return self.connectors[int(connector)].phases[L - 1].current
 
     def get_net_current_for_L(self, L):
-        physical_L = str(L)
-        return self.status["connectors"]["1"]["packet"]["ext"].get(
-            f"exmcl{physical_L}", 0
-        )
+        return self.net_currents[L - 1]
 
     def get_connector_charging_state(self, connector) -> str:
-        return self.status["connectors"][str(connector)]["packet"]["chargingStatus"]
+        return self.connectors[int(connector)].charging_status
 
     def is_connector_charging(self, connector) -> bool:
-        return self.get_connector_charging_state(connector).startswith("CHARGING")
+        return self.connectors[int(connector)].is_charging
+
+    def is_connector_car_connected(self, connector) -> bool:
+        return self.connectors[int(connector)].car_connected
+
+    def is_any_connector_active(self) -> bool:
+        return any(c.is_charging or c.car_connected for c in self.connectors.values())
 
     def get_auth_status(self):
         return self.status.get("authTag")
 
-    def update(self) -> None:
+    async def update(self) -> None:
         _LOGGER.debug("update all")
-        self.update_info()
-        self.update_status()
+        if self.is_info_stale():
+            await self.update_info()
+        await self.update_status()
         if self.initializing:
             self.initializing = False
             default = self.info["config"].get("MaxDefaultCurrent", 0.0)
-            self.tmp_charging_limit = [default, default, default, default]
+            self.tmp_charging_limit = [
+                default if limit is None else limit
+                for limit in self.tmp_charging_limit
+            ]
+
+    async def update_info(self) -> None:
+        await self.get_info()
+
+    async def update_status(self) -> None:
+        await self.get_status()
+
+    def is_info_stale(self) -> bool:
+        return (
+            self.info_fetched_at is None
+            or time.monotonic() - self.info_fetched_at > INFO_REFRESH_INTERVAL
+        )
+
+    def invalidate_info(self) -> None:
+        """Make the next update() fetch /automation/info again."""
+        self.info_fetched_at = None
+
+
+class ChuckTransport:
+    """Source of status updates besides the regular /automation/status poll.
+
+    The polling transport never connects. Push transports call on_status after
+    each status they stored with set_status() and on_connection_change when
+    they connect or drop, so the coordinator can fall back to fast polling.
+    """
+
+    name = TRANSPORT_POLLING
+
+    def __init__(self) -> None:
+        self.connected = False
+        self.fallback_reason: str | None = None
+        self.pushes = 0
+        self.last_push: float | None = None
+        self._chargebox: ChuckChargeBox | None = None
+        self._on_status: Callable[[], None] | None = None
+        self._on_connection_change: Callable[[], None] | None = None
+
+    async def async_start(
+        self,
+        chargebox: ChuckChargeBox,
+        on_status: Callable[[], None],
+        on_connection_change: Callable[[], None],
+    ) -> None:
+        self._chargebox = chargebox
+        self._on_status = on_status
+        self._on_connection_change = on_connection_change
+
+    async def async_stop(self) -> None:
+        self._detach()
+        self._set_connected(False)
+
+    def _detach(self) -> None:
+        # A chargebox that is closing must not be polled again on the way out.
+        self._on_status = self._on_connection_change = None
+
+    def _set_connected(self, connected: bool) -> None:
+        if connected == self.connected:
+            return
+        self.connected = connected
+        if self._on_connection_change is not None:
+            self._on_connection_change()
+
+    def _push_status(self, status: dict) -> None:
+        """Store a pushed status, a bad one is logged rather than raised to the source."""
+        if not isinstance(status, dict) or "connectors" not in status:
+            _LOGGER.debug("Ignoring pushed status without connectors: %s", status)
+            return
+        if self._on_status is None:
+            return
+        try:
+            self._chargebox.set_status(status)
+            self._on_status()
+        except Exception:  # malformed payload or a failing coordinator listener
+            _LOGGER.exception(
+                "Error handling status pushed by %s: %s",
+                self._chargebox.get_friendly_name(),
+                status,
+            )
+            return
+        self.pushes += 1
+        self.last_push = time.monotonic()
+
+    def get_stats(self) -> dict:
+        return {
+            "transport": self.name,
+            "connected": self.connected,
+            "fallback_reason": self.fallback_reason,
+            "pushes": self.pushes,
+            "seconds_since_last_push": (
+                None
+                if self.last_push is None
+                else round(time.monotonic() - self.last_push, 1)
+            ),
+        }
+
+
+class ChuckPollingTransport(ChuckTransport):
+    """Status is only fetched by the coordinator poll."""
+
+
+class ChuckStreamTransport(ChuckTransport):
+    """Receive status updates over a server-sent events stream of the chargebox.
+
+    Firmware without the stream endpoint answers 404 or 405, the transport then
+    stays disconnected for good. Dropped streams and other error answers are
+    retried with backoff.
+    """
+
+    name = TRANSPORT_STREAM
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._task: asyncio.Task | None = None
+        self._session: aiohttp.ClientSession | None = None
+
+    async def async_start(self, chargebox, on_status, on_connection_change) -> None:
+        await super().async_start(chargebox, on_status, on_connection_change)
+        # The stream holds its connection open, keep it out of the polling pool.
+        self._session = aiohttp.ClientSession(
+            headers=chargebox.auth_headers,
+            timeout=aiohttp.ClientTimeout(
+                total=None,
+                sock_connect=chargebox.timeouts[TIMEOUT_STATUS].sock_connect,
+                sock_read=STREAM_READ_TIMEOUT,
+            ),
+        )
+        self._task = chargebox.hass.async_create_background_task(
+            self._run(), f"{DOMAIN} status stream {chargebox.get_friendly_name()}"
+        )
+
+    async def async_stop(self) -> None:
+        self._detach()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        await super().async_stop()
+
+    async def _run(self) -> None:
+        retry = STREAM_RETRY_MIN
+        try:
+            while True:
+                try:
+                    await self._listen()
+                except ChuckRestError as err:
+                    self.fallback_reason = err.http_message
+                    if err.status in STREAM_UNSUPPORTED_STATUS:
+                        _LOGGER.info(
+                            "Status stream of %s not available (%s), polling instead",
+                            self._chargebox.get_friendly_name(),
+                            err.http_message,
+                        )
+                        return
+                    _LOGGER.debug(
+                        "Status stream of %s refused: %s",
+                        self._chargebox.get_friendly_name(),
+                        err.http_message,
+                    )
+                except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+                    _LOGGER.debug(
+                        "Status stream of %s dropped: %r",
+                        self._chargebox.get_friendly_name(),
+                        err,
+                    )
+                if self.connected:
+                    retry = STREAM_RETRY_MIN
+                self._set_connected(False)
+                await asyncio.sleep(retry)
+                retry = min(retry * 2, STREAM_RETRY_MAX)
+        finally:
+            # Whatever ends the task, the coordinator must go back to fast polling.
+            self._set_connected(False)
+
+    async def _listen(self) -> None:
+        url = f"{self._chargebox.base_url}{STREAM_PATH}"
+        async with self._session.get(
+            url, headers={aiohttp.hdrs.ACCEPT: "text/event-stream"}
+        ) as response:
+            if response.status != 200:
+                raise ChuckRestError(
+                    f"REST HTTP Error {response.status}", status=response.status
+                )
+            self._set_connected(True)
+            self.fallback_reason = None
+            data: list[str] = []
+            async for raw_line in response.content:
+                line = raw_line.decode().rstrip("\r\n")
+                if line.startswith("data:"):
+                    data.append(line[5:].lstrip())
+                elif not line and data:
+                    self._handle_event("\n".join(data))
+                    data = []
+
+    def _handle_event(self, data: str) -> None:
+        try:
+            status = json.loads(data)
+        except ValueError:
+            _LOGGER.debug(
+                "Ignoring malformed status event of %s: %s",
+                self._chargebox.get_friendly_name(),
+                data,
+            )
+            return
+        self._push_status(status)
+
+
+class ChuckMqttTransport(ChuckTransport):
+    """Receive status updates published by the chargebox to a local MQTT broker."""
+
+    name = TRANSPORT_MQTT
+
+    def __init__(self, topic: str) -> None:
+        super().__init__()
+        self.topic = topic
+        self._unsub: Callable[[], None] | None = None
+
+    async def async_start(self, chargebox, on_status, on_connection_change) -> None:
+        await super().async_start(chargebox, on_status, on_connection_change)
+        from homeassistant.components import mqtt
+
+        if not self.topic:
+            self.fallback_reason = "no MQTT topic configured"
+        elif not await mqtt.async_wait_for_mqtt_client(chargebox.hass):
+            self.fallback_reason = "MQTT integration not set up"
+        if self.fallback_reason is not None:
+            _LOGGER.warning(
+                "Cannot receive status of %s over MQTT (%s), polling instead",
+                chargebox.get_friendly_name(),
+                self.fallback_reason,
+            )
+            return
+        self._unsub = await mqtt.async_subscribe(
+            chargebox.hass, self.topic, self._message_received
+        )
+        self._set_connected(True)
+
+    async def async_stop(self) -> None:
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        await super().async_stop()
+
+    @callback
+    def _message_received(self, msg) -> None:
+        try:
+            status = json.loads(msg.payload)
+        except ValueError:
+            _LOGGER.debug("Ignoring malformed status on %s: %s", msg.topic, msg.payload)
+            return
+        self._push_status(status)
 
-    def update_info(self) -> None:
-        self.get_info()
 
-    def update_status(self) -> None:
-        self.get_status()
+def create_transport(name: str, mqtt_topic: str | None = None) -> ChuckTransport:
+    if name == TRANSPORT_STREAM:
+        return ChuckStreamTransport()
+    if name == TRANSPORT_MQTT:
+        return ChuckMqttTransport(mqtt_topic)
+    return ChuckPollingTransport()
 
 
 class ChuckRestTimeout(Exception):
@@ -285,5 +1017,6 @@ class ChuckAuthError(Exception):
 class ChuckRestError(Exception):
     """Chuck Rest error"""
 
-    def __init__(self, http_message) -> None:
+    def __init__(self, http_message, status=None) -> None:
         self.http_message = http_message
+        self.status = status
@@ -0,0 +1,442 @@
+"""Batching and queueing of connector commands for the Chuck Charger Control integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+
+from . import chuck_rest
+from .const import DOMAIN
+from .fleet import record_latency
+
+if TYPE_CHECKING:
+    from .coordinator import ChuckDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Commands issued within this many seconds of the first one share one flush.
+COMMAND_COOLDOWN = 0.5
+# Attempts per command on timeouts and 5xx answers, the delay doubles after each.
+COMMAND_ATTEMPTS = 3
+COMMAND_RETRY_DELAY = 0.5
+# A command whose effect is not visible in the status after this long is unconfirmed.
+CONFIRM_TIMEOUT = 15
+RECENT_COMMANDS = 20
+
+COMMAND_MAX_CURRENT = "max_current"
+COMMAND_ENABLE_CHARGING = "enable_charging"
+COMMAND_TRANSACTION = "transaction"
+
+STATE_QUEUED = "queued"
+STATE_SENDING = "sending"
+STATE_SENT = "sent"
+STATE_CONFIRMED = "confirmed"
+STATE_UNCONFIRMED = "unconfirmed"
+STATE_SUPERSEDED = "superseded"
+STATE_FAILED = "failed"
+
+
+class ChuckCommand:
+    """One write to a chargebox, keyed by connector, and what became of it."""
+
+    __slots__ = (
+        "kind",
+        "values",
+        "state",
+        "attempts",
+        "error",
+        "queued_at",
+        "sent_at",
+        "done_at",
+        "future",
+    )
+
+    def __init__(self, kind: str, values: dict[int, Any]) -> None:
+        self.kind = kind
+        self.values = values
+        self.state = STATE_QUEUED
+        self.attempts = 0
+        self.error: str | None = None
+        self.queued_at = time.monotonic()
+        self.sent_at: float | None = None
+        self.done_at: float | None = None
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    async def async_send(self, chargebox: chuck_rest.ChuckChargeBox) -> None:
+        if self.kind == COMMAND_MAX_CURRENT:
+            await chargebox.set_connectors_max_charging_current(self.values)
+        elif self.kind == COMMAND_ENABLE_CHARGING:
+            for connector_id, state in self.values.items():
+                await chargebox.set_connector_enable_charging(connector_id, state)
+        else:
+            for connector_id, action in self.values.items():
+                await chargebox.set_connector_charging_start(action, connector_id)
+
+    def is_confirmed(self, chargebox: chuck_rest.ChuckChargeBox) -> bool | None:
+        """Tell whether the last status shows the effect, None if it cannot show it."""
+        if self.kind == COMMAND_MAX_CURRENT:
+            if chargebox.is_info_stale():
+                return False
+            return all(
+                float(chargebox.get_connector_max_charging_current(connector_id))
+                == float(value)
+                for connector_id, value in self.values.items()
+            )
+        if self.kind == COMMAND_ENABLE_CHARGING:
+            return all(
+                chargebox.is_connector_charging_enabled(connector_id) == state
+                for connector_id, state in self.values.items()
+            )
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "values": self.values,
+            "state": self.state,
+            "attempts": self.attempts,
+            "error": self.error,
+            "latency": (
+                None if self.done_at is None else round(self.done_at - self.queued_at, 3)
+            ),
+        }
+
+
+class ChuckCommandQueue:
+    """Send the commands of one chargebox one at a time.
+
+    A queued command that is not yet sent loses the connectors a newer command
+    of the same kind sets again, and is dropped as superseded once none are
+    left. Timeouts and 5xx answers are retried with backoff. After sending,
+    the command is checked against the following status updates.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: ChuckDataUpdateCoordinator
+    ) -> None:
+        self.hass = hass
+        self.coordinator = coordinator
+        self.chargebox = coordinator.chargebox
+        self._pending: deque[ChuckCommand] = deque()
+        self._worker: asyncio.Task | None = None
+        self._confirming: set[asyncio.Task] = set()
+        self.in_flight: ChuckCommand | None = None
+        self.recent: deque[ChuckCommand] = deque(maxlen=RECENT_COMMANDS)
+        self.counts = {
+            STATE_SENT: 0,
+            STATE_CONFIRMED: 0,
+            STATE_UNCONFIRMED: 0,
+            STATE_SUPERSEDED: 0,
+            STATE_FAILED: 0,
+            "retries": 0,
+        }
+        self.latency: dict[str, dict[str, float]] = {}
+
+    async def async_submit(self, command: ChuckCommand) -> ChuckCommand:
+        """Queue a command and wait until it is sent, superseded or has failed."""
+        return await asyncio.shield(self.enqueue(command))
+
+    @callback
+    def enqueue(self, command: ChuckCommand) -> asyncio.Future:
+        """Queue a command, return the future resolved once it is sent."""
+        self._supersede(command)
+        self._pending.append(command)
+        if self._worker is None:
+            self._worker = self.hass.async_create_background_task(
+                self._run(),
+                f"{DOMAIN} command queue {self.chargebox.get_friendly_name()}",
+            )
+        return command.future
+
+    def is_pending(self, kind: str, connector_id: int) -> bool:
+        """Tell whether a queued or in flight command of this kind sets the connector."""
+        return any(
+            command.kind == kind and connector_id in command.values
+            for command in (*self._pending, self.in_flight)
+            if command is not None
+        )
+
+    def _supersede(self, command: ChuckCommand) -> None:
+        for queued in list(self._pending):
+            if queued.kind != command.kind or command.kind == COMMAND_TRANSACTION:
+                continue
+            for connector_id in command.values.keys() & queued.values.keys():
+                del queued.values[connector_id]
+            if not queued.values:
+                self._pending.remove(queued)
+                self._finish(queued, STATE_SUPERSEDED)
+                queued.future.set_result(queued)
+
+    async def _run(self) -> None:
+        """Send queued commands until the queue is empty."""
+        try:
+            while self._pending:
+                command = self._pending.popleft()
+                self.in_flight = command
+                try:
+                    await self._async_send(command)
+                except Exception as err:  # keep the queue alive for the next command
+                    _LOGGER.exception("Unexpected error sending %s", command.kind)
+                    if not command.future.done():
+                        command.error = str(err)
+                        self._finish(command, STATE_FAILED)
+                        command.future.set_exception(err)
+                finally:
+                    self.in_flight = None
+        finally:
+            self._worker = None
+
+    async def _async_send(self, command: ChuckCommand) -> None:
+        if self.coordinator.breaker.is_open:
+            # Retrying against a chargebox that does not answer polls only piles up timeouts.
+            err = chuck_rest.ChuckRestTimeout(
+                f"Chargebox {self.chargebox.get_friendly_name()} is unreachable"
+            )
+            command.error = str(err)
+            self._finish(command, STATE_FAILED)
+            command.future.set_exception(err)
+            return
+        command.state = STATE_SENDING
+        started_at = time.monotonic()
+        while True:
+            command.attempts += 1
+            try:
+                await command.async_send(self.chargebox)
+            except (chuck_rest.ChuckRestTimeout, chuck_rest.ChuckRestError) as err:
+                transient = isinstance(err, chuck_rest.ChuckRestTimeout) or (
+                    err.status is not None and err.status >= 500
+                )
+                if transient and command.attempts < COMMAND_ATTEMPTS:
+                    self.counts["retries"] += 1
+                    await asyncio.sleep(COMMAND_RETRY_DELAY * 2 ** (command.attempts - 1))
+                    continue
+                command.error = getattr(err, "http_message", None) or str(err)
+                self._finish(command, STATE_FAILED)
+                command.future.set_exception(err)
+                return
+            except chuck_rest.ChuckAuthError as err:
+                command.error = str(err)
+                self._finish(command, STATE_FAILED)
+                command.future.set_exception(err)
+                return
+            break
+        command.sent_at = time.monotonic()
+        record_latency(self.latency, "queue_wait", started_at - command.queued_at)
+        record_latency(self.latency, "send", command.sent_at - started_at)
+        command.state = STATE_SENT
+        self.counts[STATE_SENT] += 1
+        command.future.set_result(command)
+        task = self.hass.async_create_background_task(
+            self._async_confirm(command),
+            f"{DOMAIN} confirm {command.kind} {self.chargebox.get_friendly_name()}",
+        )
+        self._confirming.add(task)
+        task.add_done_callback(self._confirming.discard)
+
+    async def _async_confirm(self, command: ChuckCommand) -> None:
+        if command.is_confirmed(self.chargebox) is None:
+            self._finish(command, STATE_SENT)
+            await self.coordinator.async_request_refresh()
+            return
+        seen = asyncio.Event()
+
+        def check() -> None:
+            if command.is_confirmed(self.chargebox):
+                seen.set()
+
+        unsub = self.coordinator.async_add_listener(check)
+        try:
+            await self.coordinator.async_request_refresh()
+            async with asyncio.timeout(CONFIRM_TIMEOUT):
+                await seen.wait()
+        except TimeoutError:
+            _LOGGER.warning(
+                "Chargebox %s did not apply %s %s within %s s",
+                self.chargebox.get_friendly_name(),
+                command.kind,
+                command.values,
+                CONFIRM_TIMEOUT,
+            )
+            self._finish(command, STATE_UNCONFIRMED)
+        else:
+            self._finish(command, STATE_CONFIRMED)
+            record_latency(self.latency, "confirm", command.done_at - command.sent_at)
+        finally:
+            unsub()
+
+    def _finish(self, command: ChuckCommand, state: str) -> None:
+        command.state = state
+        command.done_at = time.monotonic()
+        if state != STATE_SENT:
+            self.counts[state] += 1
+        self.recent.append(command)
+
+    async def async_shutdown(self) -> None:
+        """Send what is still queued, then stop the worker and pending confirmations."""
+        while self._pending or self.in_flight is not None:
+            command = self._pending[-1] if self._pending else self.in_flight
+            try:
+                await asyncio.shield(command.future)
+            except (
+                chuck_rest.ChuckRestTimeout,
+                chuck_rest.ChuckRestError,
+                chuck_rest.ChuckAuthError,
+            ):
+                pass
+        for task in (self._worker, *self._confirming):
+            if task is not None:
+                task.cancel()
+        self._worker = None
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "queue_depth": len(self._pending),
+            "in_flight": None if self.in_flight is None else self.in_flight.as_dict(),
+            **self.counts,
+            "latency": self.latency,
+            "recent": [command.as_dict() for command in self.recent],
+        }
+
+
+class ChuckCommandBatcher:
+    """Coalesce max current and enable/disable commands for all connectors of a chargebox.
+
+    Max current changes of every connector go out as a single unitconfig POST.
+    The /api/status endpoint takes one connector per request, so enable and
+    disable are only deduplicated: the last state requested per connector wins.
+    Batches are handed to the command queue of the chargebox. Each caller only
+    learns the outcome of the commands holding its own connectors.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: ChuckDataUpdateCoordinator
+    ) -> None:
+        self.coordinator = coordinator
+        self.chargebox = coordinator.chargebox
+        self.queue = ChuckCommandQueue(hass, coordinator)
+        self._max_currents: dict[int, float] = {}
+        self._enable: dict[int, bool] = {}
+        # (kind, connectors, future) of every caller waiting for the next flush
+        self._waiters: list[tuple[str, set[int], asyncio.Future]] = []
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=COMMAND_COOLDOWN,
+            immediate=False,
+            function=self._async_flush,
+        )
+        self.stats = {"requested": 0, "skipped": 0, "coalesced": 0, "posts": 0}
+
+    async def async_set_max_charging_current(
+        self, connector_id: int, max_charging_current: float
+    ) -> None:
+        """Queue a max charging current and wait until the batch holding it is sent."""
+        await self.async_set_max_charging_currents({connector_id: max_charging_current})
+
+    async def async_set_max_charging_currents(
+        self, max_charging_currents: dict[int, float]
+    ) -> None:
+        """Queue max charging currents of several connectors and wait until they are sent."""
+        queued = set()
+        for connector_id, max_charging_current in max_charging_currents.items():
+            connector_id = int(connector_id)
+            self.stats["requested"] += 1
+            if (
+                connector_id not in self._max_currents
+                and not self.queue.is_pending(COMMAND_MAX_CURRENT, connector_id)
+                and not self.chargebox.is_info_stale()
+                and float(self.chargebox.get_connector_max_charging_current(connector_id))
+                == float(max_charging_current)
+            ):
+                self.stats["skipped"] += 1
+                continue
+            if connector_id in self._max_currents:
+                self.stats["coalesced"] += 1
+            self._max_currents[connector_id] = max_charging_current
+            queued.add(connector_id)
+        if queued:
+            await self._async_wait_for_flush(COMMAND_MAX_CURRENT, queued)
+
+    async def async_set_enable_charging(self, connector_id: int, state: bool) -> None:
+        """Queue enabling or disabling a connector and wait until it is sent."""
+        connector_id = int(connector_id)
+        self.stats["requested"] += 1
+        if connector_id in self._enable:
+            self.stats["coalesced"] += 1
+        self._enable[connector_id] = state
+        await self._async_wait_for_flush(COMMAND_ENABLE_CHARGING, {connector_id})
+
+    async def async_start_transaction(self, connector_id: int, action: str) -> None:
+        """Send a transaction action right away, it is never batched or superseded."""
+        await self.queue.async_submit(
+            ChuckCommand(COMMAND_TRANSACTION, {int(connector_id): action})
+        )
+
+    async def _async_wait_for_flush(self, kind: str, connector_ids: set[int]) -> None:
+        flushed = asyncio.get_running_loop().create_future()
+        self._waiters.append((kind, connector_ids, flushed))
+        await self._debouncer.async_call()
+        await flushed
+
+    async def _async_flush(self) -> None:
+        """Send the buffered commands, then those buffered meanwhile, until none are left.
+
+        The debouncer drops calls made while a flush runs, so commands queued
+        during one are picked up here rather than waiting for a call that never comes.
+        """
+        while self._waiters:
+            await self._async_flush_batch()
+
+    async def _async_flush_batch(self) -> None:
+        max_currents, self._max_currents = self._max_currents, {}
+        enable, self._enable = self._enable, {}
+        waiters, self._waiters = self._waiters, []
+        commands = []
+        if max_currents:
+            commands.append(ChuckCommand(COMMAND_MAX_CURRENT, max_currents))
+        commands.extend(
+            ChuckCommand(COMMAND_ENABLE_CHARGING, {connector_id: state})
+            for connector_id, state in enable.items()
+        )
+        # The queue drops superseded connectors from commands, remember them now.
+        connectors = [(command.kind, set(command.values)) for command in commands]
+        self.stats["posts"] += len(commands)
+        # Queue them right away, a command requested meanwhile must see them pending.
+        results = await asyncio.gather(
+            *(asyncio.shield(self.queue.enqueue(command)) for command in commands),
+            return_exceptions=True,
+        )
+        for kind, connector_ids, flushed in waiters:
+            if flushed.done():  # the caller gave up waiting
+                continue
+            errors = [
+                result
+                for (command_kind, command_ids), result in zip(connectors, results)
+                if isinstance(result, Exception)
+                and command_kind == kind
+                and command_ids & connector_ids
+            ]
+            if errors:
+                flushed.set_exception(errors[0])
+            else:
+                flushed.set_result(None)
+
+    async def async_shutdown(self) -> None:
+        """Send what is still queued and stop accepting commands."""
+        self._debouncer.async_shutdown()
+        if self._waiters:
+            await self._async_flush()
+        await self.queue.async_shutdown()
+
+    def get_stats(self) -> dict:
+        return {
+            "pending_max_currents": dict(self._max_currents),
+            "pending_enable": dict(self._enable),
+            **self.stats,
+            "queue": self.queue.get_stats(),
+        }
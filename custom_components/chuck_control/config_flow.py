@@ -1,6 +1,7 @@
 """Config flow for Chuck Charger Control integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -10,19 +11,51 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import selector
 
 from .chuck_rest import ChuckAuthError, ChuckChargeBox, ChuckRestError, ChuckRestTimeout
 from .const import (
+    CONF_DEADBAND_CURRENT,
+    CONF_DEADBAND_POWER,
+    CONF_DEADBAND_VOLTAGE,
+    CONF_LOAD_BALANCING,
+    CONF_MAIN_FUSE_CURRENT,
+    CONF_MQTT_TOPIC,
+    CONF_SCAN_INTERVAL_ACTIVE,
+    CONF_SCAN_INTERVAL_IDLE,
+    CONF_SITE_BALANCING,
+    CONF_SITE_WEIGHT,
+    CONF_SURPLUS_POWER_ENTITY,
+    CONF_TIMEOUT_COMMAND,
+    CONF_TIMEOUT_CONNECT,
+    CONF_TIMEOUT_INFO,
+    CONF_TIMEOUT_PROBE,
+    CONF_TIMEOUT_STATUS,
+    CONF_TRANSPORT,
     CONF_DEFAULT_API_BASE_URL,
     CONF_DEFAULT_API_PWD,
     CONF_DEFAULT_API_USER,
+    DEFAULT_MAIN_FUSE_CURRENT,
+    DEFAULT_SCAN_INTERVAL_ACTIVE,
+    DEFAULT_SCAN_INTERVAL_IDLE,
+    DEFAULT_SITE_WEIGHT,
+    DEFAULT_TIMEOUT_COMMAND,
+    DEFAULT_TIMEOUT_CONNECT,
+    DEFAULT_TIMEOUT_INFO,
+    DEFAULT_TIMEOUT_PROBE,
+    DEFAULT_TIMEOUT_STATUS,
     DOMAIN,
     PHASE_ORDER_DICT,
     PHASE_ORDER_DICT_DEFAULT_CFG,
+    TRANSPORT_POLLING,
+    TRANSPORTS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# A chargebox that cannot answer within this deadline is reported as a timeout.
+VALIDATE_TIMEOUT = 10
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Chuck Charger Control."""
@@ -89,16 +122,19 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         chuckapi = ChuckChargeBox(self.hass, url, username, password)
 
         try:
-            await self.hass.async_add_executor_job(chuckapi.update)
+            async with asyncio.timeout(VALIDATE_TIMEOUT):
+                await chuckapi.update()
         except ChuckAuthError:
             errors["base"] = "invalid_auth"
             return await self._show_setup_form(errors)
-        except ChuckRestTimeout:
+        except (ChuckRestTimeout, TimeoutError):
             errors["base"] = "timeout"
             return await self._show_setup_form(errors)
         except ChuckRestError as err:
             errors["base"] = err.http_message
             return await self._show_setup_form(errors)
+        finally:
+            await chuckapi.close()
 
         return self.async_create_entry(
             title=user_input["friendly_name"],
@@ -139,6 +175,51 @@ class ChuckOptionsFlowHandler(config_entries.OptionsFlow):
                     "is_connected_to_ocpp",
                     default=self.config_entry.data.get("is_connected_to_ocpp"),
                 ): cv.boolean,
+                vol.Optional(
+                    CONF_SCAN_INTERVAL_ACTIVE, default=DEFAULT_SCAN_INTERVAL_ACTIVE
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+                vol.Optional(
+                    CONF_SCAN_INTERVAL_IDLE, default=DEFAULT_SCAN_INTERVAL_IDLE
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=600)),
+                vol.Optional(CONF_DEADBAND_CURRENT, default=0): vol.All(
+                    vol.Coerce(float), vol.Range(min=0)
+                ),
+                vol.Optional(CONF_DEADBAND_VOLTAGE, default=0): vol.All(
+                    vol.Coerce(float), vol.Range(min=0)
+                ),
+                vol.Optional(CONF_DEADBAND_POWER, default=0): vol.All(
+                    vol.Coerce(float), vol.Range(min=0)
+                ),
+                vol.Optional(CONF_TRANSPORT, default=TRANSPORT_POLLING): vol.In(
+                    TRANSPORTS
+                ),
+                vol.Optional(CONF_MQTT_TOPIC, default=""): cv.string,
+                vol.Optional(CONF_LOAD_BALANCING, default=False): cv.boolean,
+                vol.Optional(
+                    CONF_MAIN_FUSE_CURRENT, default=DEFAULT_MAIN_FUSE_CURRENT
+                ): vol.All(vol.Coerce(int), vol.Range(min=6, max=630)),
+                vol.Optional(CONF_SITE_BALANCING, default=False): cv.boolean,
+                vol.Optional(CONF_SITE_WEIGHT, default=DEFAULT_SITE_WEIGHT): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=10)
+                ),
+                vol.Optional(CONF_SURPLUS_POWER_ENTITY): selector.EntitySelector(
+                    selector.EntitySelectorConfig(domain="sensor", device_class="power")
+                ),
+                vol.Optional(
+                    CONF_TIMEOUT_CONNECT, default=DEFAULT_TIMEOUT_CONNECT
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=30)),
+                vol.Optional(
+                    CONF_TIMEOUT_STATUS, default=DEFAULT_TIMEOUT_STATUS
+                ): vol.All(vol.Coerce(float), vol.Range(min=1, max=60)),
+                vol.Optional(
+                    CONF_TIMEOUT_INFO, default=DEFAULT_TIMEOUT_INFO
+                ): vol.All(vol.Coerce(float), vol.Range(min=1, max=60)),
+                vol.Optional(
+                    CONF_TIMEOUT_COMMAND, default=DEFAULT_TIMEOUT_COMMAND
+                ): vol.All(vol.Coerce(float), vol.Range(min=1, max=60)),
+                vol.Optional(
+                    CONF_TIMEOUT_PROBE, default=DEFAULT_TIMEOUT_PROBE
+                ): vol.All(vol.Coerce(float), vol.Range(min=1, max=60)),
             }
         )
         if user_input is not None:
@@ -151,16 +232,19 @@ class ChuckOptionsFlowHandler(config_entries.OptionsFlow):
 
 
             try:
-                await self.hass.async_add_executor_job(chuckapi.update)
+                async with asyncio.timeout(VALIDATE_TIMEOUT):
+                    await chuckapi.update()
             except ChuckAuthError:
                 errors["base"] = "invalid_auth"
                 return  self.async_show_form(data_schema=self.add_suggested_values_to_schema(data_schema,self.config_entry.options), errors=errors)
-            except ChuckRestTimeout:
+            except (ChuckRestTimeout, TimeoutError):
                 errors["base"] = "timeout"
                 return  self.async_show_form(data_schema=self.add_suggested_values_to_schema(data_schema,self.config_entry.options), errors=errors)
             except ChuckRestError as err:
                 errors["base"] = err.http_message
                 return  self.async_show_form(data_schema=self.add_suggested_values_to_schema(data_schema,self.config_entry.options), errors=errors)
+            finally:
+                await chuckapi.close()
 
             return self.async_create_entry(
                 data=user_input,
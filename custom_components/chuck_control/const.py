@@ -22,3 +22,35 @@ CONF_HAVE_NET_CURRENT_SENSOR = "have_net_current_sensor"
 CONF_DEFAULT_API_BASE_URL = "http://localhost"
 CONF_DEFAULT_API_USER = "admin"
 CONF_DEFAULT_API_PWD = "admin"
+CONF_SCAN_INTERVAL_ACTIVE = "scan_interval_active"
+CONF_SCAN_INTERVAL_IDLE = "scan_interval_idle"
+DEFAULT_SCAN_INTERVAL_ACTIVE = 2
+DEFAULT_SCAN_INTERVAL_IDLE = 30
+CONF_DEADBAND_CURRENT = "deadband_current"
+CONF_DEADBAND_VOLTAGE = "deadband_voltage"
+CONF_DEADBAND_POWER = "deadband_power"
+DATA_FLEET = f"{DOMAIN}_fleet"
+CONF_TRANSPORT = "transport"
+CONF_MQTT_TOPIC = "mqtt_topic"
+TRANSPORT_POLLING = "polling"
+TRANSPORT_STREAM = "stream"
+TRANSPORT_MQTT = "mqtt"
+TRANSPORTS = [TRANSPORT_POLLING, TRANSPORT_STREAM, TRANSPORT_MQTT]
+CONF_LOAD_BALANCING = "load_balancing"
+CONF_MAIN_FUSE_CURRENT = "main_fuse_current"
+DEFAULT_MAIN_FUSE_CURRENT = 25
+DATA_SITE = f"{DOMAIN}_site"
+CONF_SITE_BALANCING = "site_balancing"
+CONF_SITE_WEIGHT = "site_weight"
+DEFAULT_SITE_WEIGHT = 1
+CONF_SURPLUS_POWER_ENTITY = "surplus_power_entity"
+CONF_TIMEOUT_CONNECT = "timeout_connect"
+CONF_TIMEOUT_STATUS = "timeout_status"
+CONF_TIMEOUT_INFO = "timeout_info"
+CONF_TIMEOUT_COMMAND = "timeout_command"
+CONF_TIMEOUT_PROBE = "timeout_probe"
+DEFAULT_TIMEOUT_CONNECT = 3
+DEFAULT_TIMEOUT_STATUS = 10
+DEFAULT_TIMEOUT_INFO = 20
+DEFAULT_TIMEOUT_COMMAND = 7
+DEFAULT_TIMEOUT_PROBE = 5
@@ -0,0 +1,144 @@
+"""Data update coordinator for the Chuck Charger Control integration."""
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from . import chuck_rest
+from .breaker import ChuckCircuitBreaker
+from .commands import ChuckCommandBatcher
+from .fleet import ChuckFleet
+from .const import DEFAULT_SCAN_INTERVAL_ACTIVE, DEFAULT_SCAN_INTERVAL_IDLE, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Commands request a refresh to confirm their effect, keep that prompt.
+REQUEST_REFRESH_COOLDOWN = 1
+
+
+class ChuckDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Fetch the chargebox once per interval and fan the snapshot out to all entities."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        chargebox: chuck_rest.ChuckChargeBox,
+        fleet: ChuckFleet,
+        entry_id: str,
+        active_interval: int = DEFAULT_SCAN_INTERVAL_ACTIVE,
+        idle_interval: int = DEFAULT_SCAN_INTERVAL_IDLE,
+        deadbands: dict[str, float] | None = None,
+    ) -> None:
+        self.active_interval = timedelta(seconds=active_interval)
+        self.idle_interval = timedelta(seconds=max(idle_interval, active_interval))
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {chargebox.get_friendly_name()}",
+            update_interval=self.active_interval,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=True
+            ),
+        )
+        self.chargebox = chargebox
+        self.fleet = fleet
+        self.entry_id = entry_id
+        self.deadbands = deadbands or {}
+        self.commands = ChuckCommandBatcher(hass, self)
+        self.breaker = ChuckCircuitBreaker()
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch info and status of the chargebox in one go.
+
+        While the circuit breaker is open a cheap /api/status probe goes first
+        and the full fetch only follows once the chargebox answers it. Each
+        request is bounded by the timeouts of its endpoint class.
+        """
+        try:
+            async with self.fleet.fetch_slot(self.entry_id):
+                if self.breaker.is_open:
+                    await self.chargebox.get_basic_status(chuck_rest.TIMEOUT_PROBE)
+                await self.chargebox.update()
+        except chuck_rest.ChuckAuthError as err:
+            raise ConfigEntryAuthFailed(
+                f"Wrong username or password supplied for chargebox {self.chargebox.get_friendly_name()}"
+            ) from err
+        except chuck_rest.ChuckRestTimeout as err:
+            self._record_failure()
+            raise UpdateFailed(
+                f"Could not connect to chargebox {self.chargebox.get_friendly_name()} at {self.chargebox.base_url}"
+            ) from err
+        except chuck_rest.ChuckRestError as err:
+            self._record_failure()
+            raise UpdateFailed(
+                f"Error communicating with chargebox {self.chargebox.get_friendly_name()}: {err.http_message}"
+            ) from err
+        self._record_success()
+        return self.chargebox.status
+
+    def _record_failure(self) -> None:
+        if self.breaker.record_failure():
+            _LOGGER.warning(
+                "Chargebox %s failed %s updates in a row, probing it every %s s or less often",
+                self.chargebox.get_friendly_name(),
+                self.breaker.failures,
+                self.breaker.backoff,
+            )
+        if self.breaker.is_open:
+            self._set_update_interval(timedelta(seconds=self.breaker.backoff))
+
+    def _record_success(self) -> None:
+        if self.breaker.record_success():
+            _LOGGER.info(
+                "Chargebox %s is reachable again", self.chargebox.get_friendly_name()
+            )
+        self._adapt_update_interval()
+
+    async def async_start_transport(self) -> None:
+        """Take pushed status updates from the chargebox transport, if it has one."""
+        await self.chargebox.transport.async_start(
+            self.chargebox, self._handle_pushed_status, self._handle_transport_change
+        )
+
+    @callback
+    def _handle_pushed_status(self) -> None:
+        self._record_success()
+        self.async_set_updated_data(self.chargebox.status)
+
+    @callback
+    def _handle_transport_change(self) -> None:
+        self._adapt_update_interval()
+        if not self.chargebox.transport.connected:
+            # Catch up on what was missed and resume polling at the fast rate.
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def _adapt_update_interval(self) -> None:
+        """Poll fast while a car is plugged in or charging, back off when all connectors are idle.
+
+        While a push transport is connected polling is only a safety net and
+        runs at the idle interval.
+        """
+        if self.chargebox.transport.connected:
+            interval = self.idle_interval
+        elif self.chargebox.is_any_connector_active():
+            interval = self.active_interval
+        else:
+            interval = self.idle_interval
+        if interval != self.update_interval:
+            _LOGGER.debug(
+                "Changing scan interval of %s to %s", self.name, interval
+            )
+            self._set_update_interval(interval)
+
+    def _set_update_interval(self, interval: timedelta) -> None:
+        old_interval = self.update_interval
+        if interval == old_interval:
+            return
+        self.update_interval = interval
+        self.fleet.async_interval_changed(self.entry_id, old_interval.total_seconds())
@@ -0,0 +1,79 @@
+"""On-disk cache of chargebox device info for the Chuck Charger Control integration."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from . import chuck_rest
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+
+def _etag(info: dict[str, Any], connectors_count: int) -> str:
+    """Return a content hash identifying one version of the cached device info."""
+    payload = json.dumps([info, connectors_count], sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class ChuckDeviceCache:
+    """Keep the device info and connector count of a chargebox across restarts.
+
+    A cached copy is only used when its etag matches its content and it was
+    stored for the chargebox URL currently configured. Writes are only
+    considered after the info was fetched again or the connector count
+    changed, and skipped while the etag is unchanged.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, base_url: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._base_url = base_url
+        self._etag: str | None = None
+        self._checked: tuple[float | None, int] | None = None
+
+    async def async_load(self) -> dict[str, Any] | None:
+        data = await self._store.async_load()
+        if not data or not data.get("info") or not data.get("connectors_count"):
+            return None
+        if data.get("base_url") != self._base_url:
+            _LOGGER.debug("Ignoring device info cached for %s", data.get("base_url"))
+            return None
+        if data.get("etag") != _etag(data["info"], data["connectors_count"]):
+            _LOGGER.warning("Ignoring corrupt device info cache for %s", self._base_url)
+            return None
+        self._etag = data["etag"]
+        return data
+
+    @callback
+    def async_schedule_save(self, chargebox: chuck_rest.ChuckChargeBox) -> None:
+        """Store the device info of the chargebox if it differs from the cached copy."""
+        if not chargebox.info or not chargebox.get_connectors_count():
+            return
+        checked = (chargebox.info_fetched_at, chargebox.get_connectors_count())
+        if checked == self._checked:
+            return
+        self._checked = checked
+        etag = _etag(chargebox.info, chargebox.get_connectors_count())
+        if etag == self._etag:
+            return
+        self._etag = etag
+        data = {
+            "base_url": self._base_url,
+            "etag": etag,
+            "info": chargebox.info,
+            "connectors_count": chargebox.get_connectors_count(),
+        }
+        self._store.async_delay_save(lambda: data, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
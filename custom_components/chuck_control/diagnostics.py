@@ -0,0 +1,95 @@
+"""Diagnostics support for the Chuck Charger Control integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .fleet import async_get_fleet
+from .site import async_get_site
+
+TO_REDACT = {"auth_user", "auth_pass", "authTag", "auth", "auth_tag"}
+INFO_TO_REDACT = TO_REDACT | {"serialNumber"}
+# Unit config keys differ between firmwares, redact those naming network,
+# OCPP backend or credential settings.
+CONFIG_REDACT_FRAGMENTS = (
+    "pass",
+    "pwd",
+    "secret",
+    "token",
+    "key",
+    "user",
+    "login",
+    "cert",
+    "pin",
+    "ssid",
+    "wifi",
+    "wlan",
+    "ocpp",
+    "url",
+    "host",
+    "address",
+    "mac",
+    "gateway",
+    "dns",
+    "apn",
+)
+
+
+def _redact_info(info: dict[str, Any]) -> dict[str, Any]:
+    """Return the device info with identifying and sensitive unit config redacted."""
+    info = async_redact_data(info, INFO_TO_REDACT)
+    if isinstance(info.get("config"), dict):
+        info["config"] = {
+            key: REDACTED
+            if any(fragment in key.lower() for fragment in CONFIG_REDACT_FRAGMENTS)
+            else value
+            for key, value in info["config"].items()
+        }
+    return info
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Holds the raw chargebox data (ext blocks, warnings, errors, unit config)
+    which is deliberately kept out of the entity state attributes.
+    """
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    load_balancer = hass.data[DOMAIN][entry.entry_id]["load_balancer"]
+    chargebox = coordinator.chargebox
+    return {
+        "options": async_redact_data(dict(entry.options), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": str(coordinator.update_interval),
+            "breaker": coordinator.breaker.get_stats(),
+        },
+        "phase_order": chargebox.get_phase_order_cfg(),
+        "pool_stats": chargebox.get_pool_stats(),
+        "requests": chargebox.get_request_stats(),
+        "transport": chargebox.transport.get_stats(),
+        "commands": coordinator.commands.get_stats(),
+        "load_balancer": None if load_balancer is None else load_balancer.get_stats(),
+        "surplus": {
+            connector_id: controller.get_stats()
+            for connector_id, controller in hass.data[DOMAIN][entry.entry_id][
+                "surplus"
+            ].items()
+        },
+        "energy_statistics": hass.data[DOMAIN][entry.entry_id][
+            "energy_statistics"
+        ].get_stats(),
+        "sessions": async_redact_data(
+            hass.data[DOMAIN][entry.entry_id]["sessions"].get_stats(), TO_REDACT
+        ),
+        "fleet": async_get_fleet(hass).get_stats(),
+        "site": async_get_site(hass).get_stats(),
+        "info": _redact_info(chargebox.info),
+        "status": async_redact_data(chargebox.status, TO_REDACT),
+    }
@@ -0,0 +1,153 @@
+"""Domain wide poll scheduler shared by all chargeboxes of the Chuck Charger Control integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DATA_FLEET
+
+_LOGGER = logging.getLogger(__name__)
+
+# A fetch is one status request, plus an info request on the slow tier.
+MAX_CONCURRENT_FETCHES = 4
+# Weight of the newest sample in rolling average latencies.
+LATENCY_SMOOTHING = 0.2
+
+
+def record_latency(
+    latency: dict[str, dict[str, float]], key: str, seconds: float
+) -> None:
+    """Fold one sample into the last, rolling average and max latency under key."""
+    stats = latency.get(key)
+    if stats is None:
+        latency[key] = {"last": seconds, "avg": seconds, "max": seconds}
+        return
+    stats["last"] = seconds
+    stats["avg"] += LATENCY_SMOOTHING * (seconds - stats["avg"])
+    stats["max"] = max(stats["max"], seconds)
+
+
+@callback
+def async_get_fleet(hass: HomeAssistant) -> ChuckFleet:
+    """Return the fleet scheduler, creating it for the first chargebox."""
+    if DATA_FLEET not in hass.data:
+        hass.data[DATA_FLEET] = ChuckFleet(hass)
+    return hass.data[DATA_FLEET]
+
+
+class ChuckFleet:
+    """Spread chargebox polls over the scan interval and cap concurrent fetches.
+
+    The chargeboxes polling at the same interval get evenly spaced phases,
+    counted from the one that fetched last. They are spaced again whenever
+    one joins, leaves or changes its interval. Unreachable ones probing with
+    backoff keep their own schedule.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, max_concurrent: int = MAX_CONCURRENT_FETCHES
+    ) -> None:
+        self.hass = hass
+        self.max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._members: dict[str, Any] = {}
+        self._unsub_stagger: dict[str, Callable[[], None]] = {}
+        self._last_fetch: dict[str, float] = {}
+        self.in_flight = 0
+        self.latency: dict[str, dict[str, dict[str, float]]] = {}
+
+    @asynccontextmanager
+    async def fetch_slot(self, entry_id: str) -> AsyncIterator[None]:
+        """Wait for a free fetch slot and record how long the fetch took."""
+        queued_at = time.monotonic()
+        async with self._semaphore:
+            started_at = time.monotonic()
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+                self._last_fetch[entry_id] = time.monotonic()
+                latency = self.latency.setdefault(entry_id, {})
+                record_latency(latency, "wait", started_at - queued_at)
+                record_latency(latency, "fetch", time.monotonic() - started_at)
+
+    @callback
+    def async_add(self, entry_id: str, coordinator) -> None:
+        """Register a coordinator and shift its poll phase away from the others."""
+        self._members[entry_id] = coordinator
+        self._async_stagger(coordinator.update_interval.total_seconds())
+
+    @callback
+    def async_interval_changed(self, entry_id: str, old_interval: float) -> None:
+        """Space the polls again after a coordinator changed its update interval."""
+        self._async_stagger(old_interval)
+        if (coordinator := self._members.get(entry_id)) is not None:
+            self._async_stagger(coordinator.update_interval.total_seconds())
+
+    @callback
+    def _async_stagger(self, interval: float) -> None:
+        """Give the coordinators polling every interval seconds evenly spaced phases."""
+        group = [
+            entry_id
+            for entry_id, coordinator in self._members.items()
+            if coordinator.update_interval.total_seconds() == interval
+            and not coordinator.breaker.is_open
+        ]
+        if len(group) < 2:
+            return
+        now = time.monotonic()
+        anchor = max(group, key=lambda entry_id: self._last_fetch.get(entry_id, now))
+        start = group.index(anchor)
+        group = group[start:] + group[:start]
+        reference = self._last_fetch.get(anchor, now)
+        if (unsub := self._unsub_stagger.pop(anchor, None)) is not None:
+            unsub()
+        for index, entry_id in enumerate(group[1:], 1):
+            delay = (reference + index * interval / len(group) - now) % interval
+            if (unsub := self._unsub_stagger.pop(entry_id, None)) is not None:
+                unsub()
+            self._unsub_stagger[entry_id] = async_call_later(
+                self.hass, delay, self._stagger_refresh(entry_id)
+            )
+
+    def _stagger_refresh(self, entry_id: str) -> Callable[[Any], None]:
+        @callback
+        def refresh(_) -> None:
+            self._unsub_stagger.pop(entry_id, None)
+            if (coordinator := self._members.get(entry_id)) is not None:
+                self.hass.async_create_task(coordinator.async_refresh())
+
+        return refresh
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Forget a coordinator once its config entry is unloaded."""
+        if (unsub := self._unsub_stagger.pop(entry_id, None)) is not None:
+            unsub()
+        coordinator = self._members.pop(entry_id, None)
+        self.latency.pop(entry_id, None)
+        self._last_fetch.pop(entry_id, None)
+        if coordinator is not None:
+            self._async_stagger(coordinator.update_interval.total_seconds())
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self.in_flight,
+            "chargeboxes": {
+                entry_id: {
+                    "friendly_name": coordinator.chargebox.get_friendly_name(),
+                    "update_interval": coordinator.update_interval.total_seconds(),
+                    **self.latency.get(entry_id, {}),
+                }
+                for entry_id, coordinator in self._members.items()
+            },
+        }
@@ -0,0 +1,163 @@
+"""Dynamic load balancing on the net current sensor for the Chuck Charger Control integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from . import chuck_rest
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import ChuckDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lowest current an EV accepts (IEC 61851), a connector below it is paused with 0 A.
+MIN_CHARGING_CURRENT = 6
+# A phase drawing less than this is taken as unused by the car, e.g. single phase charging.
+PHASE_IN_USE_CURRENT = 1.0
+# Headroom kept free on every phase for load that appears between two polls.
+SAFETY_MARGIN = 1.0
+# Limit changes smaller than this are not written.
+LIMIT_DEADBAND = 1
+# Raising limits is rate limited, lowering them is not.
+MIN_WRITE_INTERVAL = 10
+
+
+class ChuckLoadBalancer:
+    """Keep the grid phase currents of a chargebox below the main fuse.
+
+    On every status update the non-EV load per physical phase is the net
+    current minus what the connectors draw on that phase, mapped through their
+    configured phase order. The rest up to the fuse is split equally between
+    connectors with a car connected on each phase, counting only the phases a
+    connector draws from (all of them until it draws), each capped at its
+    temporary charging limit, and written as MaxCurrent_N through the command
+    batcher.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: ChuckDataUpdateCoordinator,
+        main_fuse_current: float,
+    ) -> None:
+        self.hass = hass
+        self.coordinator = coordinator
+        self.chargebox = coordinator.chargebox
+        self.main_fuse_current = main_fuse_current
+        self.limits: dict[int, int] = {}
+        self.available: tuple[float, float, float] | None = None
+        self.last_write: float | None = None
+        self.writes = 0
+        self._writing = False
+
+    @callback
+    def async_start(self) -> Callable[[], None]:
+        """Run the controller now and on every coordinator update until unsubscribed."""
+        unsub = self.coordinator.async_add_listener(self._handle_coordinator_update)
+        self._handle_coordinator_update()
+        return unsub
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if not self.coordinator.last_update_success or self._writing:
+            return
+        limits = self.compute_limits()
+        changed = {
+            connector_id: limit
+            for connector_id, limit in limits.items()
+            if connector_id not in self.limits
+            or abs(limit - self.limits[connector_id]) >= LIMIT_DEADBAND
+        }
+        if not changed:
+            return
+        lowering = any(
+            limit < self.limits.get(connector_id, limit + 1)
+            for connector_id, limit in changed.items()
+        )
+        if (
+            not lowering
+            and self.last_write is not None
+            and time.monotonic() - self.last_write < MIN_WRITE_INTERVAL
+        ):
+            return
+        self._writing = True
+        self.hass.async_create_background_task(
+            self._async_write(changed),
+            f"{DOMAIN} load balancing {self.chargebox.get_friendly_name()}",
+        )
+
+    def compute_limits(self) -> dict[int, int]:
+        """Return the new max current of every connector with a car connected."""
+        connectors = self.chargebox.connectors.values()
+        drawn = [0.0, 0.0, 0.0]
+        for connector in connectors:
+            for phase in connector.phases:
+                drawn[phase.physical_phase - 1] += phase.current
+        self.available = tuple(
+            max(
+                self.main_fuse_current
+                - SAFETY_MARGIN
+                - (self.chargebox.get_net_current_for_L(L) - drawn[L - 1]),
+                0.0,
+            )
+            for L in (1, 2, 3)
+        )
+        # Physical phases each connector draws from, all of them until it draws.
+        active = {
+            connector.connector_id: tuple(
+                phase.physical_phase
+                for phase in connector.phases
+                if phase.current >= PHASE_IN_USE_CURRENT
+            )
+            or tuple(phase.physical_phase for phase in connector.phases)
+            for connector in connectors
+            if connector.car_connected or connector.is_charging
+        }
+        sharing = [0, 0, 0]
+        for phases in active.values():
+            for L in phases:
+                sharing[L - 1] += 1
+        limits = {}
+        for connector_id, phases in active.items():
+            share = min(
+                (self.available[L - 1] / sharing[L - 1] for L in phases), default=0.0
+            )
+            cap = self.chargebox.get_connector_charging_cap(connector_id)
+            limit = int(min(share, cap))
+            limits[connector_id] = limit if limit >= MIN_CHARGING_CURRENT else 0
+        return limits
+
+    async def _async_write(self, limits: dict[int, int]) -> None:
+        self.last_write = time.monotonic()
+        try:
+            await self.coordinator.commands.async_set_max_charging_currents(limits)
+        except (
+            chuck_rest.ChuckRestTimeout,
+            chuck_rest.ChuckRestError,
+            chuck_rest.ChuckAuthError,
+        ) as err:
+            _LOGGER.warning(
+                "Could not write load balancing limits %s to %s: %s",
+                limits,
+                self.chargebox.get_friendly_name(),
+                err,
+            )
+        else:
+            self.writes += 1
+            self.limits.update(limits)
+        finally:
+            self._writing = False
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "main_fuse_current": self.main_fuse_current,
+            "available": self.available,
+            "limits": self.limits,
+            "writes": self.writes,
+        }
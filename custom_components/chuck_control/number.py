@@ -1,11 +1,13 @@
 import logging
 from homeassistant import config_entries, core
-from homeassistant.components.number import NumberEntity
+from homeassistant.components.number import RestoreNumber
 from homeassistant.const import UnitOfElectricCurrent
-from homeassistant.helpers import entity_platform
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from .const import DOMAIN
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from . import chuck_rest
+from .const import CONF_SITE_BALANCING, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,20 +18,48 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ):
     _LOGGER.debug("ASYNC SETUP ENTRY")
-    chargebox = hass.data[DOMAIN][config_entry.entry_id]["chargebox"]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     to_add = []
-    for connector in range(chargebox.get_connectors_count()):
-        to_add.append(MaxChargingLimitConnector(chargebox, connector + 1))
+    for connector in range(coordinator.chargebox.get_connectors_count()):
+        to_add.append(MaxChargingLimitConnector(coordinator, connector + 1))
 
     async_add_entities(to_add)
 
 
-class MaxChargingLimitConnector(NumberEntity):
-    def __init__(self, chargebox, connectorId) -> None:
-        super().__init__()
-        self.chargebox = chargebox
+class MaxChargingLimitConnector(CoordinatorEntity, RestoreNumber):
+    """Temporary charging limit of a connector, written as MaxCurrent_N without persisting it.
+
+    While a load balancer or surplus charging sets the connector limits, the
+    value caps what they give the connector instead of being written directly.
+    """
+
+    def __init__(self, coordinator, connectorId) -> None:
+        super().__init__(coordinator)
+        self.chargebox = coordinator.chargebox
         self.cid = str(connectorId)
-        self.test_value = 1.0
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if (last_number_data := await self.async_get_last_number_data()) is None:
+            return
+        if last_number_data.native_value is None:
+            return
+        self.chargebox.set_connector_tmp_charging_limit(
+            self.cid, last_number_data.native_value
+        )
+        # The chargebox forgets unpersisted limits when it restarts.
+        self.hass.async_create_background_task(
+            self._async_restore(), f"{DOMAIN} restore charging limit {self.unique_id}"
+        )
+
+    async def _async_restore(self) -> None:
+        # A limit at MaxDefaultCurrent limits nothing, leave MaxCurrent_N as it is.
+        if self.native_value >= self.native_max_value:
+            return
+        try:
+            await self._async_apply()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Could not restore charging limit: %s", err)
 
     @property
     def name(self) -> str:
@@ -37,7 +67,7 @@ class MaxChargingLimitConnector(NumberEntity):
         return f"Connector {self.cid} max/{self.chargebox.get_friendly_name()}/{self.chargebox.info['serialNumber']}"
 
     @property
-    def unit_of_measurement(self) -> str:
+    def native_unit_of_measurement(self) -> str:
         return UnitOfElectricCurrent.AMPERE
 
     @property
@@ -53,20 +83,50 @@ class MaxChargingLimitConnector(NumberEntity):
         return self.chargebox.get_device_info()
 
     @property
-    def value(self) -> float:
+    def native_value(self) -> float | None:
         return self.chargebox.get_connector_tmp_charging_limit(self.cid)
 
     @property
-    def min_value(self) -> float:
+    def native_min_value(self) -> float:
         return 0.0
 
     @property
-    def max_value(self) -> float:
+    def native_max_value(self) -> float:
         return float(self.chargebox.info.get("config").get(f"MaxDefaultCurrent"))
 
     @property
-    def step(self) -> float:
+    def native_step(self) -> float:
         return 1.0
 
-    def set_value(self, value: float) -> None:
-        return self.chargebox.set_connector_tmp_charging_limit(self.cid, value)
+    async def async_set_native_value(self, value: float) -> None:
+        self.chargebox.set_connector_tmp_charging_limit(self.cid, value)
+        self.async_write_ha_state()
+        await self._async_apply()
+
+    def _is_managed(self) -> bool:
+        chargebox_cfg = self.hass.data[DOMAIN][self.coordinator.entry_id]
+        surplus = chargebox_cfg["surplus"].get(int(self.cid))
+        return (
+            chargebox_cfg["load_balancer"] is not None
+            or bool(chargebox_cfg.get(CONF_SITE_BALANCING))
+            or (surplus is not None and surplus.enabled)
+        )
+
+    async def _async_apply(self) -> None:
+        if self._is_managed():
+            # The controller picks up the new cap with the next status.
+            await self.coordinator.async_request_refresh()
+            return
+        try:
+            await self.coordinator.commands.async_set_max_charging_current(
+                self.cid, int(self.native_value)
+            )
+        except (
+            chuck_rest.ChuckRestTimeout,
+            chuck_rest.ChuckRestError,
+            chuck_rest.ChuckAuthError,
+        ) as err:
+            raise HomeAssistantError(
+                f"Could not write charging limit of connector {self.cid} to "
+                f"{self.chargebox.get_friendly_name()}: {err}"
+            ) from err
@@ -1,4 +1,3 @@
-from datetime import timedelta
 import logging
 
 import voluptuous as vol
@@ -18,18 +17,29 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfPower,
     UnitOfTemperature,
+    UnitOfTime,
 )
+from homeassistant.core import callback
 from homeassistant.helpers import entity_platform
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import Any
-
-from .const import CONF_HAVE_NET_CURRENT_SENSOR, DOMAIN
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import (
+    CONF_DEADBAND_CURRENT,
+    CONF_DEADBAND_POWER,
+    CONF_DEADBAND_VOLTAGE,
+    CONF_HAVE_NET_CURRENT_SENSOR,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(seconds=2)
+STATUS_ENDPOINT = "/api/admin/automation/status"
+INFO_ENDPOINT = "/api/admin/automation/info"
+
 DEFAULT_BASE_URL = "https://demo.evexpert.eu/demo/"
 DEFAULT_AUTH_NAME = "admin"
 DEFAULT_AUTH_PASS = "admin"
@@ -52,30 +62,41 @@ async def async_setup_entry(
     _LOGGER.debug("ASYNC SETUP ENTRY")
     chargebox_cfg = config_entry.options
     have_net_current_sensor = chargebox_cfg[CONF_HAVE_NET_CURRENT_SENSOR]
-    chargebox = hass.data[DOMAIN][config_entry.entry_id]["chargebox"]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    chargebox = coordinator.chargebox
 
     if chargebox.info:
-        async_add_entities([ChargeBoxTotal(chargebox)])
-        async_add_entities([ChargeBoxSessionEnergy(chargebox)])
+        async_add_entities([ChargeBoxTotal(coordinator)])
+        async_add_entities([ChargeBoxSessionEnergy(coordinator)])
+        async_add_entities(
+            [
+                ChargeBoxRequestLatency(coordinator, STATUS_ENDPOINT, "Status"),
+                ChargeBoxRequestLatency(coordinator, INFO_ENDPOINT, "Info"),
+                ChargeBoxRequestErrors(coordinator),
+                ChargeBoxLastRequestSuccess(coordinator),
+            ]
+        )
         to_add = []
         for connector in range(chargebox.get_connectors_count()):
-            to_add.append(ConnectorCurrent(chargebox, connector + 1))
-            to_add.append(ConnectorStatus(chargebox, connector + 1))
-            to_add.append(ConnectorVoltage(chargebox, connector + 1))
-            to_add.append(ConnectorPower(chargebox, connector + 1))
-
-            to_add.append(ConnectorActual(chargebox, connector + 1))
-            to_add.append(ConnectorTotal(chargebox, connector + 1))
-            to_add.append(ConnectorInternalTemp(chargebox, connector + 1))
-
-            to_add.append(ConnectorCurrentPhase(chargebox, connector + 1, 1))
-            to_add.append(ConnectorCurrentPhase(chargebox, connector + 1, 2))
-            to_add.append(ConnectorCurrentPhase(chargebox, connector + 1, 3))
+            to_add.append(ConnectorCurrent(coordinator, connector + 1))
+            to_add.append(ConnectorStatus(coordinator, connector + 1))
+            to_add.append(ConnectorVoltage(coordinator, connector + 1))
+            to_add.append(ConnectorPower(coordinator, connector + 1))
+
+            to_add.append(ConnectorActual(coordinator, connector + 1))
+            to_add.append(ConnectorTotal(coordinator, connector + 1))
+            to_add.append(ConnectorInternalTemp(coordinator, connector + 1))
+            to_add.append(ConnectorWarnings(coordinator, connector + 1))
+            to_add.append(ConnectorErrors(coordinator, connector + 1))
+
+            to_add.append(ConnectorCurrentPhase(coordinator, connector + 1, 1))
+            to_add.append(ConnectorCurrentPhase(coordinator, connector + 1, 2))
+            to_add.append(ConnectorCurrentPhase(coordinator, connector + 1, 3))
             if have_net_current_sensor and connector + 1 == 1:
-                to_add.append(NetCurrentSensor(chargebox, connector + 1))
-                to_add.append(NetCurrentPhaseSensor(chargebox, 1))
-                to_add.append(NetCurrentPhaseSensor(chargebox, 2))
-                to_add.append(NetCurrentPhaseSensor(chargebox, 3))
+                to_add.append(NetCurrentSensor(coordinator, connector + 1))
+                to_add.append(NetCurrentPhaseSensor(coordinator, 1))
+                to_add.append(NetCurrentPhaseSensor(coordinator, 2))
+                to_add.append(NetCurrentPhaseSensor(coordinator, 3))
         async_add_entities(to_add)
     else:
         _LOGGER.error(f"Cannot add {chargebox}")
@@ -83,11 +104,19 @@ async def async_setup_entry(
     platform.async_register_entity_service(
         "set_max_charging_current",
         {
-            vol.Required("entity_id"): cv.entity_id,
+            vol.Required("entity_id"): cv.comp_entity_ids,
             vol.Required("max_charging_current"): cv.positive_int,
         },
         "set_max_charging_current",
     )
+    platform.async_register_entity_service(
+        "set_charging_enabled",
+        {
+            vol.Required("entity_id"): cv.comp_entity_ids,
+            vol.Required("enabled"): cv.boolean,
+        },
+        "set_charging_enabled",
+    )
 
 
 def get_friendly_name(
@@ -111,11 +140,57 @@ def get_friendly_name(
     return name
 
 
-class NetCurrentSensor(SensorEntity):
+class ChuckSensorEntity(CoordinatorEntity, SensorEntity):
+    """Sensor which only writes its state when the data behind it changed.
+
+    Sensors bound to a connector (``connector_id``) are skipped when that
+    connector's snapshot is unchanged, chargebox wide sensors when no connector
+    changed. Sensors naming a ``deadband_option`` additionally ignore numeric
+    state changes smaller than the deadband configured in the options flow,
+    unless their state attributes changed.
+    """
+
+    deadband_option: str | None = None
+
+    def __init__(self, coordinator) -> None:
+        super().__init__(coordinator)
+        self.chargebox = coordinator.chargebox
+        self._written_available = None
+        self._written_state = None
+        self._written_attributes = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self.available == self._written_available and not self._has_changed():
+            return
+        self._written_available = self.available
+        self._written_state = self.state if self.available else None
+        if self.deadband_option is not None:
+            self._written_attributes = self.state_attributes if self.available else None
+        self.async_write_ha_state()
+
+    def _has_changed(self) -> bool:
+        changed = self.chargebox.changed_connectors
+        if hasattr(self, "connector_id"):
+            if int(self.connector_id) not in changed:
+                return False
+        elif not changed:
+            return False
+        deadband = self.coordinator.deadbands.get(self.deadband_option, 0)
+        if deadband and self._written_state is not None:
+            if abs(self.state - self._written_state) >= deadband:
+                return True
+            # e.g. the max current after an info refresh, whatever the state did
+            return self.state_attributes != self._written_attributes
+        return True
+
+
+class NetCurrentSensor(ChuckSensorEntity):
     _attr_device_class = SensorDeviceClass.CURRENT
+    deadband_option = CONF_DEADBAND_CURRENT
 
-    def __init__(self, chargebox, connector_id) -> None:
-        self.chargebox = chargebox
+    def __init__(self, coordinator, connector_id) -> None:
+        super().__init__(coordinator)
         self.connector_id = str(connector_id)
         self._attr_name = f"NtCurentSenzor Connector {connector_id} status"
         self.friendly_name_appendix = "External EVSE net sensor"
@@ -143,29 +218,22 @@ class NetCurrentSensor(SensorEntity):
 
     @property
     def state(self) -> Any:
-        ext = self.chargebox.status["connectors"][self.connector_id]["packet"]["ext"]
-        total_current = (
-            ext.get("exmcl1", 0) + ext.get("exmcl2", 0) + ext.get("exmcl3", 0)
-        )
-        return float(total_current)
+        return float(sum(self.chargebox.net_currents))
 
     @property
     def state_attributes(self) -> dict[str, Any]:
-        return {
-            "connector_id": self.connector_id,
-            "ext": self.chargebox.status["connectors"][self.connector_id]["packet"][
-                "ext"
-            ],
-        }
+        return {"connector_id": self.connector_id}
 
     @property
     def device_info(self) -> DeviceInfo:
         return self.chargebox.get_device_info()
 
 
-class NetCurrentPhaseSensor(SensorEntity):
-    def __init__(self, chargebox, phase_number) -> None:
-        self.chargebox = chargebox
+class NetCurrentPhaseSensor(ChuckSensorEntity):
+    deadband_option = CONF_DEADBAND_CURRENT
+
+    def __init__(self, coordinator, phase_number) -> None:
+        super().__init__(coordinator)
         self.phase_number = phase_number
         self.friendly_name_appendix = "Net current"
         self.friendly_name = get_friendly_name(self)
@@ -200,16 +268,16 @@ class NetCurrentPhaseSensor(SensorEntity):
 
     @property
     def icon(self) -> str:
-        if self.state > 0:
+        if self.available and self.state > 0:
             return f"mdi:numeric-{self.phase_number}-box-outline"
         return f"mdi:numeric-{self.phase_number}"
 
 
-class ConnectorStatus(SensorEntity):
+class ConnectorStatus(ChuckSensorEntity):
     _attr_icon = "mdi:ev-plug-type2"
 
-    def __init__(self, chargebox, connector_id) -> None:
-        self.chargebox = chargebox
+    def __init__(self, coordinator, connector_id) -> None:
+        super().__init__(coordinator)
         self.connector_id = str(connector_id)
         self._attr_name = f"Connector {connector_id} status"
         self.friendly_name_appendix = "Status"
@@ -229,37 +297,15 @@ class ConnectorStatus(SensorEntity):
 
     @property
     def state_attributes(self) -> dict[str, Any]:
+        connector = self.chargebox.get_connector(self.connector_id)
         return {
             "connector_id": self.connector_id,
-            "session_energy": self.chargebox.get_connector_session_energy(
-                self.connector_id
-            ),
-            "total_energy": self.chargebox.get_connector_total_energy(
-                self.connector_id
-            ),
-            "charging_current": self.chargebox.get_connector_current(self.connector_id),
             "max_enabled_current": self.chargebox.get_connector_max_charging_current(
                 self.connector_id
             ),
-            "charging_status": self.chargebox.status["connectors"][self.connector_id][
-                "packet"
-            ]["chargingStatus"],
-            "lock_status": self.chargebox.status["connectors"][self.connector_id][
-                "packet"
-            ]["lockStatus"],
-            "car_connected": self.chargebox.status["connectors"][self.connector_id][
-                "carConnected"
-            ],
-            "internal_temp": self.chargebox.status["connectors"][self.connector_id][
-                "packet"
-            ]["internalTemperature"],
-            "warnings": self.chargebox.status["connectors"][self.connector_id][
-                "packet"
-            ]["warnings"],
-            "errors": self.chargebox.status["connectors"][self.connector_id]["packet"][
-                "errors"
-            ],
-            "phase_order": self.chargebox.get_phase_order_cfg(),
+            "charging_status": connector.charging_status,
+            "lock_status": connector.lock_status,
+            "car_connected": connector.car_connected,
             "auth": self.chargebox.get_auth_status(),
         }
 
@@ -268,18 +314,34 @@ class ConnectorStatus(SensorEntity):
         return self.chargebox.get_device_info()
 
     async def set_max_charging_current(entity, max_charging_current=0):
-        await entity.chargebox.set_connector_max_charging_current(
+        await entity.coordinator.commands.async_set_max_charging_current(
             entity.connector_id, max_charging_current
         )
 
+    async def set_charging_enabled(entity, enabled=True):
+        await entity.coordinator.commands.async_set_enable_charging(
+            entity.connector_id, enabled
+        )
+
 
-class ConnectorCurrent(SensorEntity):
-    def __init__(self, chargebox, connector_id) -> None:
-        self.chargebox = chargebox
+class ConnectorCurrent(ChuckSensorEntity):
+    deadband_option = CONF_DEADBAND_CURRENT
+
+    def __init__(self, coordinator, connector_id) -> None:
+        super().__init__(coordinator)
         self.connector_id = connector_id
         self._attr_name = f"Connector {connector_id} Current"
         self.friendly_name_appendix = "Total current"
         self.friendly_name = get_friendly_name(self)
+        self._written_tmp_limit = None
+
+    def _has_changed(self) -> bool:
+        # The temporary limit is set by the number entity, the status does not show it.
+        tmp_limit = self.chargebox.get_connector_tmp_charging_limit(self.connector_id)
+        if tmp_limit != self._written_tmp_limit:
+            self._written_tmp_limit = tmp_limit
+            return True
+        return super()._has_changed()
 
     @property
     def unique_id(self) -> str:
@@ -310,36 +372,10 @@ class ConnectorCurrent(SensorEntity):
         cid = str(self.connector_id)
         return {
             "connector_id ": self.connector_id,
-            "charger_id": self.chargebox.info['serialNumber'],
-            "current_L1": self.chargebox.get_current_for_connector_L(cid, 1),
-            "current_L2": self.chargebox.get_current_for_connector_L(cid, 2),
-            "current_L3": self.chargebox.get_current_for_connector_L(cid, 3),
             "max_charging_current": self.chargebox.info["config"][f"MaxCurrent_{cid}"],
             "temp_charging_current": self.chargebox.get_connector_tmp_charging_limit(
                 self.connector_id
             ),
-            "default_max_charging_current": self.chargebox.info.get("config").get(
-                "MaxDefaultCurrent"
-            ),
-            "max_current_net_override": self.chargebox.info.get("config").get(
-                "MaxCurrentNet"
-            ),
-            "wanted_state": self.chargebox.status["connectors"][cid]["status"],
-            "charging_state": self.chargebox.status["connectors"][
-                str(self.connector_id)
-            ]["packet"]["chargingStatus"],
-            "lock_state": self.chargebox.status["connectors"][str(self.connector_id)][
-                "packet"
-            ]["lockStatus"],
-            "car_connected": self.chargebox.status["connectors"][
-                str(self.connector_id)
-            ]["carConnected"],
-            "actual_wh": self.chargebox.status["connectors"][str(self.connector_id)][
-                "packet"
-            ]["actualWh"],
-            "total_wh": self.chargebox.status["connectors"][str(self.connector_id)][
-                "packet"
-            ]["totalWh"],
         }
 
     @property
@@ -348,19 +384,26 @@ class ConnectorCurrent(SensorEntity):
 
     @property
     def icon(self) -> str:
-        if self.chargebox.is_connector_charging(self.connector_id):
+        if self.available and self.chargebox.is_connector_charging(self.connector_id):
             return "mdi:flash"
         return "mdi:flash-outline"
 
     async def set_max_charging_current(entity, max_charging_current=0):
-        await entity.chargebox.set_connector_max_charging_current(
+        await entity.coordinator.commands.async_set_max_charging_current(
             entity.connector_id, max_charging_current
         )
 
+    async def set_charging_enabled(entity, enabled=True):
+        await entity.coordinator.commands.async_set_enable_charging(
+            entity.connector_id, enabled
+        )
+
 
-class ConnectorCurrentPhase(SensorEntity):
-    def __init__(self, chargebox, connector_id, phase_number) -> None:
-        self.chargebox = chargebox
+class ConnectorCurrentPhase(ChuckSensorEntity):
+    deadband_option = CONF_DEADBAND_CURRENT
+
+    def __init__(self, coordinator, connector_id, phase_number) -> None:
+        super().__init__(coordinator)
         self.connector_id = connector_id
         self.phase_number = phase_number
         self.friendly_name_appendix = "Current"
@@ -405,14 +448,16 @@ class ConnectorCurrentPhase(SensorEntity):
 
     @property
     def icon(self) -> str:
-        if self.state > 0:
+        if self.available and self.state > 0:
             return f"mdi:numeric-{self.phase_number}-box-outline"
         return f"mdi:numeric-{self.phase_number}"
 
 
-class ConnectorVoltage(SensorEntity):
-    def __init__(self, chargebox, connector_id) -> None:
-        self.chargebox = chargebox
+class ConnectorVoltage(ChuckSensorEntity):
+    deadband_option = CONF_DEADBAND_VOLTAGE
+
+    def __init__(self, coordinator, connector_id) -> None:
+        super().__init__(coordinator)
         self.connector_id = connector_id
         self.friendly_name_appendix = "Voltage"
         self.friendly_name = get_friendly_name(self)
@@ -446,9 +491,11 @@ class ConnectorVoltage(SensorEntity):
         return True
 
 
-class ConnectorPower(SensorEntity):
-    def __init__(self, chargebox, connector_id) -> None:
-        self.chargebox = chargebox
+class ConnectorPower(ChuckSensorEntity):
+    deadband_option = CONF_DEADBAND_POWER
+
+    def __init__(self, coordinator, connector_id) -> None:
+        super().__init__(coordinator)
         self.connector_id = connector_id
         self.friendly_name_appendix = "Actual power"
         self.friendly_name = get_friendly_name(self)
@@ -486,9 +533,9 @@ class ConnectorPower(SensorEntity):
         return f"{self.chargebox.info['serialNumber']}_connector_{self.connector_id}_actual_power"
 
 
-class ConnectorTotal(SensorEntity):
-    def __init__(self, chargebox, connector_id) -> None:
-        self.chargebox = chargebox
+class ConnectorTotal(ChuckSensorEntity):
+    def __init__(self, coordinator, connector_id) -> None:
+        super().__init__(coordinator)
         self.connector_id = connector_id
         self.friendly_name_appendix = "Total energy"
         self.friendly_name = get_friendly_name(self)
@@ -507,7 +554,7 @@ class ConnectorTotal(SensorEntity):
 
     @property
     def state_class(self) -> SensorStateClass:
-        return SensorStateClass.TOTAL
+        return SensorStateClass.TOTAL_INCREASING
 
     @property
     def state(self) -> Any:
@@ -525,9 +572,9 @@ class ConnectorTotal(SensorEntity):
         return f"{self.chargebox.info['serialNumber']}_connector_{self.connector_id}_energy_total"
 
 
-class ConnectorActual(SensorEntity):
-    def __init__(self, chargebox, connecotr_id) -> None:
-        self.chargebox = chargebox
+class ConnectorActual(ChuckSensorEntity):
+    def __init__(self, coordinator, connecotr_id) -> None:
+        super().__init__(coordinator)
         self.connector_id = connecotr_id
         self.friendly_name_appendix = "Actual energy"
         self.friendly_name = get_friendly_name(self)
@@ -564,9 +611,9 @@ class ConnectorActual(SensorEntity):
         return f"{self.chargebox.info['serialNumber']}_connector_{self.connector_id}_energy_actual"
 
 
-class ChargeBoxTotal(SensorEntity):
-    def __init__(self, chargebox) -> None:
-        self.chargebox = chargebox
+class ChargeBoxTotal(ChuckSensorEntity):
+    def __init__(self, coordinator) -> None:
+        super().__init__(coordinator)
         self.friendly_name_appendix = "Total energy"
         self.friendly_name = get_friendly_name(self)
 
@@ -584,7 +631,7 @@ class ChargeBoxTotal(SensorEntity):
 
     @property
     def state_class(self) -> SensorStateClass:
-        return SensorStateClass.TOTAL
+        return SensorStateClass.TOTAL_INCREASING
 
     @property
     def state(self) -> Any:
@@ -603,9 +650,9 @@ class ChargeBoxTotal(SensorEntity):
         return {"connector_count ": self.chargebox.get_connectors_count()}
 
 
-class ChargeBoxSessionEnergy(SensorEntity):
-    def __init__(self, chargebox) -> None:
-        self.chargebox = chargebox
+class ChargeBoxSessionEnergy(ChuckSensorEntity):
+    def __init__(self, coordinator) -> None:
+        super().__init__(coordinator)
         self.friendly_name_appendix = "Actual energy"
         self.friendly_name = get_friendly_name(self)
 
@@ -637,17 +684,14 @@ class ChargeBoxSessionEnergy(SensorEntity):
     def unit_of_measurement(self) -> str:
         return UnitOfEnergy.KILO_WATT_HOUR
 
-    def update(self) -> None:
-        self.chargebox.update()
-
     @property
     def state_attributes(self) -> dict[str, Any]:
         return {"connector_count ": self.chargebox.get_connectors_count()}
 
 
-class ChargeBoxTotalEnergy(SensorEntity):
-    def __init__(self, chargebox) -> None:
-        self.chargebox = chargebox
+class ChargeBoxTotalEnergy(ChuckSensorEntity):
+    def __init__(self, coordinator) -> None:
+        super().__init__(coordinator)
         self.friendly_name_appendix = "Total energy"
         self.friendly_name = get_friendly_name(self)
 
@@ -673,23 +717,160 @@ class ChargeBoxTotalEnergy(SensorEntity):
 
     @property
     def state_class(self) -> SensorStateClass:
-        return SensorStateClass.MEASUREMENT
+        return SensorStateClass.TOTAL_INCREASING
 
     @property
     def unit_of_measurement(self) -> str:
         return UnitOfEnergy.KILO_WATT_HOUR
 
-    def update(self) -> None:
-        self.chargebox.update()
-
     @property
     def state_attributes(self) -> dict[str, Any]:
         return {"connector_count ": self.chargebox.get_connectors_count()}
 
 
-class ConnectorInternalTemp(SensorEntity):
-    def __init__(self, chargebox, connector_id) -> None:
-        self.chargebox = chargebox
+class ChargeBoxRequestDiagnostic(ChuckSensorEntity):
+    """Request statistics of the chargebox, written on every update.
+
+    These stay available while the chargebox does not answer, which is when
+    they matter most.
+    """
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    def _has_changed(self) -> bool:
+        return True
+
+    @property
+    def name(self) -> str:
+        return self.friendly_name
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return self.chargebox.get_device_info()
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        return False
+
+
+class ChargeBoxRequestLatency(ChargeBoxRequestDiagnostic):
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(self, coordinator, endpoint: str, label: str) -> None:
+        super().__init__(coordinator)
+        self.endpoint = endpoint
+        self.label = label
+        self.friendly_name_appendix = f"{label} request latency"
+        self.friendly_name = get_friendly_name(self)
+
+    @property
+    def unique_id(self) -> str:
+        serial = self.chargebox.info["serialNumber"]
+        return f"{serial}_{self.label.lower()}_request_latency"
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        return SensorDeviceClass.DURATION
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def unit_of_measurement(self) -> str:
+        return UnitOfTime.MILLISECONDS
+
+    @property
+    def state(self) -> Any:
+        if (stats := self.chargebox.get_endpoint_stats(self.endpoint)) is None:
+            return None
+        return stats.percentile(95)
+
+    @property
+    def state_attributes(self) -> dict[str, Any] | None:
+        if (stats := self.chargebox.get_endpoint_stats(self.endpoint)) is None:
+            return None
+        return {
+            "p50": stats.percentile(50),
+            "p99": stats.percentile(99),
+            "success": stats.success,
+            "error": stats.error,
+            "timeout": stats.timeout,
+        }
+
+
+class ChargeBoxRequestErrors(ChargeBoxRequestDiagnostic):
+    _attr_icon = "mdi:lan-disconnect"
+
+    def __init__(self, coordinator) -> None:
+        super().__init__(coordinator)
+        self.friendly_name_appendix = "Request errors"
+        self.friendly_name = get_friendly_name(self)
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self.chargebox.info['serialNumber']}_request_errors"
+
+    @property
+    def state_class(self) -> SensorStateClass:
+        return SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def state(self) -> Any:
+        stats = self.chargebox.get_request_stats()
+        return stats["error"] + stats["timeout"]
+
+    @property
+    def state_attributes(self) -> dict[str, Any]:
+        stats = self.chargebox.get_request_stats()
+        return {
+            "timeouts": stats["timeout"],
+            "requests": stats["success"] + stats["error"] + stats["timeout"],
+            "last_errors": {
+                endpoint: endpoint_stats["last_error"]
+                for endpoint, endpoint_stats in stats["endpoints"].items()
+                if endpoint_stats["last_error"]
+            },
+        }
+
+
+class ChargeBoxLastRequestSuccess(ChargeBoxRequestDiagnostic):
+    _attr_icon = "mdi:lan-check"
+
+    def __init__(self, coordinator) -> None:
+        super().__init__(coordinator)
+        self.friendly_name_appendix = "Last successful request"
+        self.friendly_name = get_friendly_name(self)
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self.chargebox.info['serialNumber']}_last_request_success"
+
+    @property
+    def device_class(self) -> SensorDeviceClass:
+        return SensorDeviceClass.TIMESTAMP
+
+    @property
+    def native_value(self) -> Any:
+        return max(
+            (
+                stats.last_success
+                for stats in self.chargebox.endpoint_stats.values()
+                if stats.last_success
+            ),
+            default=None,
+        )
+
+
+class ConnectorInternalTemp(ChuckSensorEntity):
+    def __init__(self, coordinator, connector_id) -> None:
+        super().__init__(coordinator)
         self.connector_id = str(connector_id)
         self._attr_name = f"NtCurentSenzor Connector {connector_id} status"
         self.friendly_name_appendix = "Internal temp"
@@ -717,11 +898,83 @@ class ConnectorInternalTemp(SensorEntity):
 
     @property
     def state(self) -> Any:
-        return float(
-            self.chargebox.status["connectors"][self.connector_id]["packet"].get(
-                "internalTemperature", 0
-            )
-        )
+        return self.chargebox.get_connector(self.connector_id).internal_temp
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return self.chargebox.get_device_info()
+
+
+class ConnectorWarnings(ChuckSensorEntity):
+    _attr_icon = "mdi:alert-outline"
+
+    def __init__(self, coordinator, connector_id) -> None:
+        super().__init__(coordinator)
+        self.connector_id = str(connector_id)
+        self.friendly_name_appendix = "Warnings"
+        self.friendly_name = get_friendly_name(self)
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self.chargebox.info['serialNumber']}_connector_{self.connector_id}_warnings"
+
+    @property
+    def name(self) -> str:
+        return self.friendly_name
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        return False
+
+    @property
+    def state(self) -> Any:
+        return len(self.chargebox.get_connector(self.connector_id).warnings or [])
+
+    @property
+    def state_attributes(self) -> dict[str, Any]:
+        return {"warnings": self.chargebox.get_connector(self.connector_id).warnings}
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return self.chargebox.get_device_info()
+
+
+class ConnectorErrors(ChuckSensorEntity):
+    _attr_icon = "mdi:alert-circle-outline"
+
+    def __init__(self, coordinator, connector_id) -> None:
+        super().__init__(coordinator)
+        self.connector_id = str(connector_id)
+        self.friendly_name_appendix = "Errors"
+        self.friendly_name = get_friendly_name(self)
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self.chargebox.info['serialNumber']}_connector_{self.connector_id}_errors"
+
+    @property
+    def name(self) -> str:
+        return self.friendly_name
+
+    @property
+    def entity_category(self) -> EntityCategory:
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        return False
+
+    @property
+    def state(self) -> Any:
+        return len(self.chargebox.get_connector(self.connector_id).errors or [])
+
+    @property
+    def state_attributes(self) -> dict[str, Any]:
+        return {"errors": self.chargebox.get_connector(self.connector_id).errors}
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -0,0 +1,290 @@
+"""Charging session log for the Chuck Charger Control integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime
+import json
+import logging
+import os
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.util import dt as dt_util
+
+from . import chuck_rest
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import ChuckDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+
+def _log_path(hass: HomeAssistant, entry_id: str) -> str:
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}.sessions.{entry_id}.jsonl")
+
+
+def _open_sessions_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.open_sessions.{entry_id}")
+
+
+async def async_remove_session_log(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the session log and the open sessions of a removed chargebox."""
+    await _open_sessions_store(hass, entry_id).async_remove()
+    path = _log_path(hass, entry_id)
+    if await hass.async_add_executor_job(os.path.exists, path):
+        await hass.async_add_executor_job(os.remove, path)
+
+
+class ChargingSession:
+    """Session of one connector, from the car connecting until it leaves."""
+
+    __slots__ = (
+        "connector_id",
+        "start",
+        "end",
+        "start_wh",
+        "energy_wh",
+        "charging_time",
+        "peak_current",
+        "auth_tag",
+        "charging_since",
+    )
+
+    def __init__(
+        self,
+        connector_id: int,
+        start: datetime,
+        start_wh: int,
+        resumed: dict[str, Any] | None = None,
+    ) -> None:
+        self.connector_id = connector_id
+        self.start = start
+        self.end: datetime | None = None
+        self.start_wh = start_wh
+        self.energy_wh = 0
+        self.charging_time = 0.0
+        self.peak_current = 0.0
+        self.auth_tag: str | None = None
+        self.charging_since: datetime | None = None
+        if resumed:
+            self.energy_wh = resumed["energy_wh"]
+            self.charging_time = resumed["charging_time"]
+            self.peak_current = resumed["peak_current"]
+            self.auth_tag = resumed["auth_tag"]
+
+    def update(self, connector: chuck_rest.ConnectorSnapshot, now: datetime) -> None:
+        if connector.total_wh >= self.start_wh:
+            self.energy_wh = connector.total_wh - self.start_wh
+        self.peak_current = max(self.peak_current, connector.current)
+        if self.charging_since is not None:
+            self.charging_time += (now - self.charging_since).total_seconds()
+            self.charging_since = None
+        if connector.is_charging:
+            self.charging_since = now
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the session as one record of the session log."""
+        end = self.end or dt_util.utcnow()
+        return {
+            "connector_id": self.connector_id,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat() if self.end else None,
+            "duration": round((end - self.start).total_seconds()),
+            "charging_time": round(self.charging_time),
+            "energy_wh": self.energy_wh,
+            "start_wh": self.start_wh,
+            "peak_current": self.peak_current,
+            "auth_tag": self.auth_tag,
+        }
+
+
+class ChuckSessionTracker:
+    """Detect charging sessions of a chargebox and append them to a session log.
+
+    A session starts when a car connects (or a connector starts charging) and
+    ends when no car is connected anymore. Its energy is the difference of the
+    connector meter, so it survives actualWh being reset by the chargebox.
+    Finished sessions are appended as one JSON line each to a log in the
+    storage directory and never rewritten. Sessions still open are saved when
+    they start or get an auth tag, so a restart resumes them; their energy is
+    taken from the meter again. One whose car left while Home Assistant was
+    stopped is logged on the first update, ending then.
+
+    The chargebox reports one authTag for all connectors. A new tag goes to
+    the only open session without one, it is left out when that is ambiguous.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: ChuckDataUpdateCoordinator,
+        entry_id: str,
+    ) -> None:
+        self.hass = hass
+        self.coordinator = coordinator
+        self.chargebox = coordinator.chargebox
+        self.path = _log_path(hass, entry_id)
+        self.sessions: dict[int, ChargingSession] = {}
+        self.logged = 0
+        self._store = _open_sessions_store(hass, entry_id)
+        self._resumed: dict[str, Any] = {}
+        self._auth_tag: str | None = None
+        self._lock = asyncio.Lock()
+
+    async def async_start(self) -> Callable[[], None]:
+        """Track sessions on every coordinator update until unsubscribed."""
+        self._resumed = (await self._store.async_load()) or {}
+        unsub = self.coordinator.async_add_listener(self._handle_coordinator_update)
+        self._handle_coordinator_update()
+        return unsub
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if not self.coordinator.last_update_success or not self.chargebox.connectors:
+            return
+        now = dt_util.utcnow()
+        auth_tag = self.chargebox.status.get("authTag")
+        changed = False
+        for connector_id, connector in self.chargebox.connectors.items():
+            if connector_id not in self.sessions and (
+                connector.car_connected or connector.is_charging
+            ):
+                self._start_session(connector, now)
+                changed = True
+        if (
+            auth_tag
+            and auth_tag != self._auth_tag
+            # still the tag of a session resumed after a restart
+            and all(s.auth_tag != auth_tag for s in self.sessions.values())
+        ):
+            untagged = [s for s in self.sessions.values() if s.auth_tag is None]
+            if len(untagged) == 1:
+                untagged[0].auth_tag = auth_tag
+                changed = True
+        self._auth_tag = auth_tag
+        for connector_id, connector in self.chargebox.connectors.items():
+            if (session := self.sessions.get(connector_id)) is None:
+                continue
+            session.update(connector, now)
+            if not (connector.car_connected or connector.is_charging):
+                del self.sessions[connector_id]
+                self._end_session(session, now)
+                changed = True
+        for connector_id, resumed in self._resumed.items():
+            self._end_resumed_session(int(connector_id), resumed, now)
+            changed = True
+        self._resumed = {}
+        if changed:
+            self._store.async_delay_save(self._open_sessions, SAVE_DELAY)
+
+    def _start_session(
+        self, connector: chuck_rest.ConnectorSnapshot, now: datetime
+    ) -> ChargingSession:
+        resumed = self._resumed.get(str(connector.connector_id))
+        if resumed is not None and resumed["start_wh"] <= connector.total_wh:
+            del self._resumed[str(connector.connector_id)]
+            session = ChargingSession(
+                connector.connector_id,
+                dt_util.parse_datetime(resumed["start"]),
+                resumed["start_wh"],
+                resumed,
+            )
+        else:
+            session = ChargingSession(connector.connector_id, now, connector.total_wh)
+        self.sessions[connector.connector_id] = session
+        return session
+
+    def _end_resumed_session(
+        self, connector_id: int, resumed: dict[str, Any], now: datetime
+    ) -> None:
+        """Log a session saved open before a restart that did not go on after it."""
+        session = ChargingSession(
+            connector_id,
+            dt_util.parse_datetime(resumed["start"]),
+            resumed["start_wh"],
+            resumed,
+        )
+        connector = self.chargebox.connectors.get(connector_id)
+        if connector is not None and connector.total_wh >= session.start_wh:
+            session.energy_wh = connector.total_wh - session.start_wh
+        _LOGGER.info(
+            "Session of connector %s of %s ended while Home Assistant was stopped",
+            connector_id,
+            self.chargebox.get_friendly_name(),
+        )
+        self._end_session(session, now)
+
+    def _end_session(self, session: ChargingSession, now: datetime) -> None:
+        session.end = now
+        self.hass.async_create_background_task(
+            self._async_append(session.as_dict()),
+            f"{DOMAIN} session log {self.chargebox.get_friendly_name()}",
+        )
+
+    def _open_sessions(self) -> dict[str, Any]:
+        return {
+            str(connector_id): session.as_dict()
+            for connector_id, session in self.sessions.items()
+        }
+
+    async def _async_append(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        async with self._lock:
+            await self.hass.async_add_executor_job(self._append, line)
+        self.logged += 1
+
+    def _append(self, line: str) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as log:
+            log.write(line)
+
+    async def async_query(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        connector_id: int | None = None,
+        auth_tag: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the logged sessions that ended between start and end, oldest first."""
+        async with self._lock:
+            records = await self.hass.async_add_executor_job(self._read)
+        sessions = []
+        for record in records:
+            ended = dt_util.parse_datetime(record["end"])
+            if start is not None and ended < start:
+                continue
+            if end is not None and ended >= end:
+                continue
+            if connector_id is not None and record["connector_id"] != connector_id:
+                continue
+            if auth_tag is not None and record["auth_tag"] != auth_tag:
+                continue
+            sessions.append(record)
+        return sessions[-limit:] if limit else sessions
+
+    def _read(self) -> list[dict[str, Any]]:
+        records = []
+        try:
+            with open(self.path, encoding="utf-8") as log:
+                for line in log:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # a line cut short by a crash while appending
+                        _LOGGER.warning("Skipping corrupt line in %s", self.path)
+        except FileNotFoundError:
+            pass
+        return records
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "open_sessions": self._open_sessions(),
+            "logged": self.logged,
+        }
@@ -0,0 +1,304 @@
+"""Site wide load balancing across all chargeboxes behind one grid connection."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+
+from . import chuck_rest
+from .const import DATA_SITE
+from .load_balancer import (
+    LIMIT_DEADBAND,
+    MIN_CHARGING_CURRENT,
+    MIN_WRITE_INTERVAL,
+    PHASE_IN_USE_CURRENT,
+    SAFETY_MARGIN,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import ChuckDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Status updates of all chargeboxes within this many seconds share one rebalance.
+REBALANCE_COOLDOWN = 1
+# Slack below which a phase or connector cap counts as used up.
+EPSILON = 1e-6
+
+
+class Demand:
+    """Connector asking for current on some of the physical phases."""
+
+    __slots__ = ("key", "weight", "cap", "phases")
+
+    def __init__(
+        self, key: tuple[str, int], weight: float, cap: float, phases: tuple[int, ...]
+    ) -> None:
+        self.key = key
+        self.weight = weight
+        self.cap = cap
+        self.phases = phases
+
+
+def water_fill(
+    demands: list[Demand], available: list[float]
+) -> dict[tuple[str, int], float]:
+    """Weighted max-min fair split of the per phase headroom between connectors.
+
+    All unfrozen connectors are raised together in proportion to their weight.
+    A connector freezes when it reaches its cap or one of its phases runs out.
+    Each round freezes at least one connector, so this takes at most len(demands)
+    rounds of O(len(demands)).
+    """
+    remaining = list(available)
+    allocation = {demand.key: 0.0 for demand in demands}
+    active = [demand for demand in demands if demand.cap > EPSILON]
+    while active:
+        weight_on_phase = [0.0, 0.0, 0.0]
+        for demand in active:
+            for phase in demand.phases:
+                weight_on_phase[phase - 1] += demand.weight
+        step = min(
+            [remaining[p] / w for p, w in enumerate(weight_on_phase) if w > 0]
+            + [(d.cap - allocation[d.key]) / d.weight for d in active]
+        )
+        step = max(step, 0.0)
+        for demand in active:
+            allocation[demand.key] += step * demand.weight
+        for p, w in enumerate(weight_on_phase):
+            remaining[p] -= step * w
+        active = [
+            demand
+            for demand in active
+            if demand.cap - allocation[demand.key] > EPSILON
+            and all(remaining[phase - 1] > EPSILON for phase in demand.phases)
+        ]
+    return allocation
+
+
+def allocate(
+    demands: list[Demand], available: list[float]
+) -> dict[tuple[str, int], int]:
+    """Split the headroom and pause connectors that would get less than the EV minimum.
+
+    The connector furthest below the minimum relative to its weight is paused
+    and the split repeated, so its share goes to the others.
+    """
+    limits = {demand.key: 0 for demand in demands}
+    demands = list(demands)
+    while demands:
+        allocation = water_fill(demands, available)
+        starved = [d for d in demands if allocation[d.key] < MIN_CHARGING_CURRENT]
+        if not starved:
+            limits.update({key: int(current) for key, current in allocation.items()})
+            break
+        demands.remove(min(starved, key=lambda d: allocation[d.key] / d.weight))
+    return limits
+
+
+@callback
+def async_get_site(hass: HomeAssistant) -> ChuckSite:
+    """Return the site balancer, creating it for the first chargebox joining it."""
+    if DATA_SITE not in hass.data:
+        hass.data[DATA_SITE] = ChuckSite(hass)
+    return hass.data[DATA_SITE]
+
+
+class ChuckSite:
+    """Keep the phase currents of all member chargeboxes below one main fuse.
+
+    Net currents come from any member with a net current sensor; without one
+    the other site load is taken as zero. Members that failed their last update
+    keep the limits they were given and get no new ones.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._members: dict[str, ChuckDataUpdateCoordinator] = {}
+        self._weights: dict[str, float] = {}
+        self._fuses: dict[str, float] = {}
+        self._unsubs: dict[str, Callable[[], None]] = {}
+        self.limits: dict[tuple[str, int], int] = {}
+        self.available: list[float] | None = None
+        self.last_write: float | None = None
+        self.last_duration: float | None = None
+        self.writes = 0
+        self._writing = False
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=REBALANCE_COOLDOWN,
+            immediate=True,
+            function=self._async_rebalance,
+        )
+
+    @property
+    def main_fuse_current(self) -> float:
+        return min(self._fuses.values())
+
+    @callback
+    def async_add(
+        self,
+        entry_id: str,
+        coordinator: ChuckDataUpdateCoordinator,
+        main_fuse_current: float,
+        weight: float = 1,
+    ) -> None:
+        """Make a chargebox take part in site balancing."""
+        self._members[entry_id] = coordinator
+        self._fuses[entry_id] = main_fuse_current
+        self._weights[entry_id] = weight
+        self._unsubs[entry_id] = coordinator.async_add_listener(
+            self._debouncer.async_schedule_call
+        )
+        self._debouncer.async_schedule_call()
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        if (unsub := self._unsubs.pop(entry_id, None)) is not None:
+            unsub()
+        self._members.pop(entry_id, None)
+        self._fuses.pop(entry_id, None)
+        self._weights.pop(entry_id, None)
+        self.limits = {
+            key: limit for key, limit in self.limits.items() if key[0] != entry_id
+        }
+
+    def compute_limits(self) -> dict[tuple[str, int], int]:
+        """Return the new max current of every connector with a car connected."""
+        net: list[float] | None = None
+        drawn = [0.0, 0.0, 0.0]
+        reserved = 0.0
+        demands = []
+        for entry_id, coordinator in self._members.items():
+            chargebox = coordinator.chargebox
+            if not coordinator.last_update_success or not chargebox.connectors:
+                reserved += sum(
+                    limit
+                    for (member, _), limit in self.limits.items()
+                    if member == entry_id
+                )
+                continue
+            if chargebox.have_net_current_sensor:
+                box_net = [chargebox.get_net_current_for_L(L) for L in (1, 2, 3)]
+                net = box_net if net is None else list(map(max, net, box_net))
+            for connector in chargebox.connectors.values():
+                for phase in connector.phases:
+                    drawn[phase.physical_phase - 1] += phase.current
+                if not (connector.car_connected or connector.is_charging):
+                    continue
+                phases = tuple(
+                    phase.physical_phase
+                    for phase in connector.phases
+                    if phase.current >= PHASE_IN_USE_CURRENT
+                ) or tuple(phase.physical_phase for phase in connector.phases)
+                demands.append(
+                    Demand(
+                        (entry_id, connector.connector_id),
+                        self._weights[entry_id],
+                        chargebox.get_connector_charging_cap(
+                            connector.connector_id
+                        ),
+                        phases,
+                    )
+                )
+        if net is None:
+            # Nothing measures the site load, only hold back what failed members may draw.
+            other = [reserved] * 3
+        else:
+            # The net current already includes whatever failed members draw.
+            other = [n - d for n, d in zip(net, drawn)]
+        self.available = [
+            max(self.main_fuse_current - SAFETY_MARGIN - load, 0.0) for load in other
+        ]
+        return allocate(demands, self.available)
+
+    async def _async_rebalance(self) -> None:
+        if not self._members or self._writing:
+            return
+        started_at = time.monotonic()
+        limits = self.compute_limits()
+        self.last_duration = time.monotonic() - started_at
+        changed = {
+            key: limit
+            for key, limit in limits.items()
+            if key not in self.limits or abs(limit - self.limits[key]) >= LIMIT_DEADBAND
+        }
+        if not changed:
+            return
+        lowering = any(
+            limit < self.limits.get(key, limit + 1) for key, limit in changed.items()
+        )
+        if (
+            not lowering
+            and self.last_write is not None
+            and time.monotonic() - self.last_write < MIN_WRITE_INTERVAL
+        ):
+            return
+        per_box: dict[str, dict[int, int]] = {}
+        for (entry_id, connector_id), limit in changed.items():
+            per_box.setdefault(entry_id, {})[connector_id] = limit
+        self._writing = True
+        self.last_write = time.monotonic()
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._members[entry_id].commands.async_set_max_charging_currents(
+                        box_limits
+                    )
+                    for entry_id, box_limits in per_box.items()
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            self._writing = False
+        self.writes += 1
+        for (entry_id, box_limits), result in zip(per_box.items(), results):
+            if (coordinator := self._members.get(entry_id)) is None:
+                # unloaded while the limits were written
+                continue
+            if isinstance(
+                result,
+                (
+                    chuck_rest.ChuckRestTimeout,
+                    chuck_rest.ChuckRestError,
+                    chuck_rest.ChuckAuthError,
+                ),
+            ):
+                _LOGGER.warning(
+                    "Could not write site balancing limits %s to %s: %s",
+                    box_limits,
+                    coordinator.chargebox.get_friendly_name(),
+                    result,
+                )
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            self.limits.update(
+                {(entry_id, connector_id): limit for connector_id, limit in box_limits.items()}
+            )
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "main_fuse_current": self.main_fuse_current if self._fuses else None,
+            "available": self.available,
+            "last_duration": self.last_duration,
+            "writes": self.writes,
+            "chargeboxes": {
+                entry_id: {
+                    "friendly_name": coordinator.chargebox.get_friendly_name(),
+                    "weight": self._weights[entry_id],
+                    "limits": {
+                        connector_id: limit
+                        for (member, connector_id), limit in self.limits.items()
+                        if member == entry_id
+                    },
+                }
+                for entry_id, coordinator in self._members.items()
+            },
+        }
@@ -0,0 +1,131 @@
+"""Hourly long-term energy statistics for the Chuck Charger Control integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import ChuckDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ChuckEnergyStatistics:
+    """Import the energy meters of a chargebox as hourly external statistics.
+
+    The last reading seen in an hour becomes the state of that hour once the
+    next hour starts; the sum grows by the difference to the previous hour.
+    A meter that went backwards, e.g. a replaced chargebox, restarts from 0.
+    The sum continues from the last imported row, so restarts and gaps in the
+    data add to the next imported hour instead of being lost.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: ChuckDataUpdateCoordinator
+    ) -> None:
+        self.hass = hass
+        self.coordinator = coordinator
+        self.chargebox = coordinator.chargebox
+        self.imported = 0
+        self.last_hour: datetime | None = None
+        self._hour: datetime | None = None
+        self._readings: dict[int | None, float] = {}
+        self._last: dict[str, tuple[float, float, float]] = {}
+
+    @callback
+    def async_start(self) -> Callable[[], None]:
+        """Import on every coordinator update until unsubscribed."""
+        if "recorder" not in self.hass.config.components:
+            _LOGGER.debug("Recorder not loaded, not importing energy statistics")
+            return lambda: None
+        return self.coordinator.async_add_listener(self._handle_coordinator_update)
+
+    def statistic_id(self, connector_id: int | None = None) -> str:
+        serial = slugify(self.chargebox.info["serialNumber"])
+        if connector_id is None:
+            return f"{DOMAIN}:{serial}_energy"
+        return f"{DOMAIN}:{serial}_connector_{connector_id}_energy"
+
+    def _metadata(self, connector_id: int | None) -> StatisticMetaData:
+        name = self.chargebox.get_friendly_name()
+        if connector_id is not None:
+            name += f" connector {connector_id}"
+        return StatisticMetaData(
+            has_mean=False,
+            has_sum=True,
+            name=f"{name} energy",
+            source=DOMAIN,
+            statistic_id=self.statistic_id(connector_id),
+            unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if not self.coordinator.last_update_success or not self.chargebox.connectors:
+            return
+        hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        if self._hour is not None and hour > self._hour:
+            self.hass.async_create_background_task(
+                self._async_import(self._hour, self._readings),
+                f"{DOMAIN} energy statistics {self.chargebox.get_friendly_name()}",
+            )
+        self._hour = hour
+        self._readings = {
+            connector_id: connector.total_wh / 1000
+            for connector_id, connector in self.chargebox.connectors.items()
+        }
+        self._readings[None] = self.chargebox.get_energy_total() / 1000
+
+    async def _async_import(
+        self, hour: datetime, readings: dict[int | None, float]
+    ) -> None:
+        for connector_id, state in readings.items():
+            statistic_id = self.statistic_id(connector_id)
+            if statistic_id not in self._last:
+                last = await get_instance(self.hass).async_add_executor_job(
+                    get_last_statistics,
+                    self.hass,
+                    1,
+                    statistic_id,
+                    False,
+                    {"state", "sum"},
+                )
+                if rows := last.get(statistic_id):
+                    row = rows[0]
+                    self._last[statistic_id] = (row["state"], row["sum"], row["start"])
+            total = 0.0
+            if (previous := self._last.get(statistic_id)) is not None:
+                last_state, last_sum, last_start = previous
+                if last_start >= hour.timestamp():
+                    continue
+                delta = state - last_state
+                total = last_sum + (delta if delta >= 0 else state)
+            async_add_external_statistics(
+                self.hass,
+                self._metadata(connector_id),
+                [StatisticData(start=hour, state=state, sum=total)],
+            )
+            self._last[statistic_id] = (state, total, hour.timestamp())
+        self.imported += 1
+        self.last_hour = hour
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "imported_hours": self.imported,
+            "last_hour": self.last_hour.isoformat() if self.last_hour else None,
+            "statistic_ids": [self.statistic_id(c) for c in self._readings],
+        }
@@ -0,0 +1,208 @@
+"""PV surplus charging for the Chuck Charger Control integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN, UnitOfPower
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from . import chuck_rest
+from .const import DOMAIN
+from .load_balancer import MIN_CHARGING_CURRENT, PHASE_IN_USE_CURRENT
+
+if TYPE_CHECKING:
+    from .coordinator import ChuckDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Time constant of the exponential smoothing of the grid power, in seconds.
+SMOOTHING_TIME = 60
+# Surplus needed above the EV minimum before charging starts, in A.
+START_MARGIN = 1
+# Grid import tolerated below the EV minimum before charging stops, in A.
+STOP_MARGIN = 1
+# Minimum time between starting and stopping a charge, in seconds.
+SWITCH_HOLD_TIME = 300
+# Minimum time between two current adjustments while charging, in seconds.
+ADJUST_HOLD_TIME = 30
+NOMINAL_VOLTAGE = 230
+
+
+class ChuckSurplusController:
+    """Make one connector charge from the power otherwise exported to the grid.
+
+    The grid power sensor reads positive while importing and negative while
+    exporting. Its smoothed value plus what the connector draws is the power
+    the car may use. Divided over the phases the car last charged on (three
+    until known) this gives the allowed current, so a single phase car starts
+    at a third of the surplus a three phase car needs.
+
+    Charging starts once the allowed current exceeds the EV minimum by
+    START_MARGIN and stops when it falls STOP_MARGIN below it; start and stop
+    are at least SWITCH_HOLD_TIME apart, adjustments ADJUST_HOLD_TIME. The
+    result is written as MaxCurrent_N, or left to the load balancer of the
+    chargebox as a cap when one is active.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: ChuckDataUpdateCoordinator,
+        connector_id: int,
+        power_entity_id: str,
+        write_limits: bool = True,
+    ) -> None:
+        self.hass = hass
+        self.coordinator = coordinator
+        self.chargebox = coordinator.chargebox
+        self.connector_id = connector_id
+        self.power_entity_id = power_entity_id
+        self.write_limits = write_limits
+        self.enabled = False
+        self.grid_power: float | None = None
+        self.phases = 3
+        self.limit: int | None = None
+        self.last_switch: float | None = None
+        self.last_adjust: float | None = None
+        self.writes = 0
+        self._sampled_at: float | None = None
+        self._unsub: Callable[[], None] | None = None
+
+    @callback
+    def async_enable(self) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        self.grid_power = None
+        self._unsub = async_track_state_change_event(
+            self.hass, self.power_entity_id, self._handle_power_change
+        )
+        if (state := self.hass.states.get(self.power_entity_id)) is not None:
+            self._add_sample(state)
+
+    @callback
+    def async_disable(self) -> None:
+        """Stop following the surplus and give the connector its usual limit back."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        self.async_shutdown()
+        self.chargebox.set_connector_surplus_charging_limit(self.connector_id, None)
+        self.limit = None
+        if self.write_limits:
+            self._write(
+                int(self.chargebox.get_connector_tmp_charging_limit(self.connector_id))
+            )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening to the power sensor without touching the chargebox."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _handle_power_change(self, event: Event[EventStateChangedData]) -> None:
+        if (state := event.data["new_state"]) is not None:
+            self._add_sample(state)
+
+    def _add_sample(self, state) -> None:
+        if state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return
+        try:
+            power = float(state.state)
+        except ValueError:
+            return
+        if state.attributes.get("unit_of_measurement") == UnitOfPower.KILO_WATT:
+            power *= 1000
+        now = time.monotonic()
+        if self.grid_power is None:
+            self.grid_power = power
+        else:
+            alpha = 1 - math.exp(-(now - self._sampled_at) / SMOOTHING_TIME)
+            self.grid_power += alpha * (power - self.grid_power)
+        self._sampled_at = now
+        self._evaluate(now)
+
+    def compute_limit(self) -> int:
+        """Return the current the surplus allows, 0 to pause the connector."""
+        connector = self.chargebox.connectors.get(self.connector_id)
+        if connector is None or self.grid_power is None:
+            return self.limit or 0
+        phases_in_use = sum(
+            phase.current >= PHASE_IN_USE_CURRENT for phase in connector.phases
+        )
+        if phases_in_use:
+            self.phases = phases_in_use
+        voltage = connector.voltage or NOMINAL_VOLTAGE
+        ev_power = sum(phase.current for phase in connector.phases) * voltage
+        allowed = (ev_power - self.grid_power) / (voltage * self.phases)
+        cap = self.chargebox.get_connector_tmp_charging_limit(self.connector_id)
+        if self.limit:
+            if allowed < MIN_CHARGING_CURRENT - STOP_MARGIN:
+                return 0
+        elif allowed < MIN_CHARGING_CURRENT + START_MARGIN:
+            return 0
+        return int(min(max(allowed, MIN_CHARGING_CURRENT), cap))
+
+    def _evaluate(self, now: float) -> None:
+        if not self.enabled or not self.coordinator.last_update_success:
+            return
+        target = self.compute_limit()
+        if target == self.limit:
+            return
+        if self.limit is not None and (target == 0) != (self.limit == 0):
+            if self.last_switch is not None and now - self.last_switch < SWITCH_HOLD_TIME:
+                return
+            self.last_switch = now
+        elif self.last_adjust is not None and now - self.last_adjust < ADJUST_HOLD_TIME:
+            return
+        if self.last_switch is None:
+            self.last_switch = now
+        self.last_adjust = now
+        self.limit = target
+        self.chargebox.set_connector_surplus_charging_limit(self.connector_id, target)
+        if self.write_limits:
+            self._write(target)
+
+    def _write(self, limit: int) -> None:
+        # A value still queued for the connector is superseded by this one.
+        self.hass.async_create_background_task(
+            self._async_write(limit),
+            f"{DOMAIN} surplus charging {self.chargebox.get_friendly_name()} {self.connector_id}",
+        )
+
+    async def _async_write(self, limit: int) -> None:
+        try:
+            await self.coordinator.commands.async_set_max_charging_current(
+                self.connector_id, limit
+            )
+        except (
+            chuck_rest.ChuckRestTimeout,
+            chuck_rest.ChuckRestError,
+            chuck_rest.ChuckAuthError,
+        ) as err:
+            _LOGGER.warning(
+                "Could not write surplus charging limit %s A to connector %s of %s: %s",
+                limit,
+                self.connector_id,
+                self.chargebox.get_friendly_name(),
+                err,
+            )
+        else:
+            self.writes += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "power_entity_id": self.power_entity_id,
+            "grid_power": self.grid_power,
+            "phases": self.phases,
+            "limit": self.limit,
+            "writes": self.writes,
+        }
@@ -0,0 +1,86 @@
+import logging
+
+from homeassistant import config_entries, core
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.const import STATE_ON
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.typing import Any
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .sensor import get_friendly_name
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: core.HomeAssistant,
+    config_entry: config_entries.ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+):
+    _LOGGER.debug("ASYNC SETUP ENTRY")
+    chargebox_cfg = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = chargebox_cfg["coordinator"]
+    async_add_entities(
+        [
+            SurplusChargingSwitch(coordinator, controller)
+            for controller in chargebox_cfg["surplus"].values()
+        ]
+    )
+
+
+class SurplusChargingSwitch(CoordinatorEntity, SwitchEntity, RestoreEntity):
+    """Let a connector follow the PV surplus measured by the grid power sensor."""
+
+    def __init__(self, coordinator, controller) -> None:
+        super().__init__(coordinator)
+        self.chargebox = coordinator.chargebox
+        self.controller = controller
+        self.connector_id = controller.connector_id
+        self.friendly_name_appendix = "Surplus charging"
+        self.friendly_name = get_friendly_name(self)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if (last_state := await self.async_get_last_state()) is not None:
+            if last_state.state == STATE_ON:
+                self.controller.async_enable()
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        self.controller.async_enable()
+        self.async_write_ha_state()
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        self.controller.async_disable()
+        self.async_write_ha_state()
+
+    @property
+    def is_on(self) -> bool:
+        return self.controller.enabled
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self.chargebox.info['serialNumber']}_connector_{self.connector_id}_surplus_charging"
+
+    @property
+    def name(self) -> str:
+        return self.friendly_name
+
+    @property
+    def icon(self) -> str:
+        return "mdi:solar-power"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return {
+            "connector_id": self.connector_id,
+            "grid_power": self.controller.grid_power,
+            "surplus_limit": self.controller.limit,
+            "phases": self.controller.phases,
+        }
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return self.chargebox.get_device_info()
@@ -0,0 +1,259 @@
+"""Benchmark the Chuck Charger Control integration against simulated chargeboxes.
+
+Needs Home Assistant installed. Starts scripts/chuck_simulator.py in process
+(or uses --url of one started separately) and measures
+
+    poll throughput  ChuckChargeBox.update() of all boxes back to back for
+                     --duration seconds through the fleet fetch slots
+    event loop lag   how late a 10 ms timer fires while a coordinator per box
+                     polls at --interval and fans out to --entities listeners
+    command RTT      time from a max current request until it is sent, batching
+                     delay included, and from sending until a status update
+                     confirms it
+
+    python scripts/chuck_benchmark.py --boxes 200 --latency 0.05 --failure-rate 0.01
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from chuck_simulator import add_arguments, simulator_from_args  # noqa: E402
+from custom_components.chuck_control import chuck_rest  # noqa: E402
+from custom_components.chuck_control.commands import STATE_CONFIRMED  # noqa: E402
+from custom_components.chuck_control.coordinator import (  # noqa: E402
+    ChuckDataUpdateCoordinator,
+)
+from custom_components.chuck_control.fleet import ChuckFleet  # noqa: E402
+
+LAG_PROBE_INTERVAL = 0.01
+
+
+def summarize(samples: list[float]) -> dict[str, Any]:
+    """Return count and percentiles in ms of samples given in seconds."""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def percentile(p: float) -> float:
+        return round(ordered[min(int(p * len(ordered)), len(ordered) - 1)] * 1000, 2)
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 2),
+        "p50_ms": percentile(0.5),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+def make_chargebox(hass: HomeAssistant, url: str, n: int) -> chuck_rest.ChuckChargeBox:
+    return chuck_rest.ChuckChargeBox(
+        hass=hass,
+        base_url=url,
+        auth_name="admin",
+        auth_pass="admin",
+        friendly_name=f"Simulated {n}",
+        have_net_current_sensor=True,
+        phase_order=["conf_1", "conf_1"],
+    )
+
+
+async def bench_poll_throughput(
+    hass: HomeAssistant, urls: list[str], duration: float
+) -> dict[str, Any]:
+    fleet = ChuckFleet(hass)
+    chargeboxes = [make_chargebox(hass, url, n) for n, url in enumerate(urls)]
+    latencies: list[float] = []
+    errors: dict[str, int] = {}
+    deadline = time.monotonic() + duration
+
+    async def poll(entry_id: str, chargebox: chuck_rest.ChuckChargeBox) -> None:
+        while time.monotonic() < deadline:
+            started_at = time.monotonic()
+            try:
+                async with fleet.fetch_slot(entry_id):
+                    await chargebox.update()
+            except Exception as err:  # the coordinator turns these into UpdateFailed
+                errors[type(err).__name__] = errors.get(type(err).__name__, 0) + 1
+                continue
+            latencies.append(time.monotonic() - started_at)
+
+    started_at = time.monotonic()
+    await asyncio.gather(*(poll(str(n), box) for n, box in enumerate(chargeboxes)))
+    elapsed = time.monotonic() - started_at
+    for chargebox in chargeboxes:
+        await chargebox.close()
+    return {
+        "polls_per_second": round(len(latencies) / elapsed, 1),
+        "status_unchanged": sum(box.status_unchanged for box in chargeboxes),
+        "errors": errors,
+        "max_concurrent": fleet.max_concurrent,
+        "latency": summarize(latencies),
+    }
+
+
+async def start_coordinators(
+    hass: HomeAssistant,
+    fleet: ChuckFleet,
+    urls: list[str],
+    interval: int,
+    entities: int,
+) -> list[ChuckDataUpdateCoordinator]:
+    coordinators = []
+    for n, url in enumerate(urls):
+        chargebox = make_chargebox(hass, url, n)
+        coordinator = ChuckDataUpdateCoordinator(
+            hass,
+            chargebox,
+            fleet,
+            str(n),
+            active_interval=interval,
+            idle_interval=interval,
+        )
+        for _ in range(entities):
+            # Stand-in for an entity reading its snapshot on every update.
+            coordinator.async_add_listener(
+                lambda chargebox=chargebox: chargebox.changed_connectors
+            )
+        coordinators.append(coordinator)
+    await asyncio.gather(*(c.async_refresh() for c in coordinators))
+    for n, coordinator in enumerate(coordinators):
+        fleet.async_add(str(n), coordinator)
+    return coordinators
+
+
+async def bench_loop_lag(duration: float) -> dict[str, Any]:
+    lags = []
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        started_at = time.monotonic()
+        await asyncio.sleep(LAG_PROBE_INTERVAL)
+        lags.append(time.monotonic() - started_at - LAG_PROBE_INTERVAL)
+    return summarize(lags)
+
+
+async def bench_command_rtt(
+    coordinators: list[ChuckDataUpdateCoordinator], commands: int
+) -> dict[str, Any]:
+    sent: list[float] = []
+    confirmed: list[float] = []
+    failed = 0
+    rng = random.Random(0)
+
+    async def command(coordinator: ChuckDataUpdateCoordinator) -> None:
+        nonlocal failed
+        started_at = time.monotonic()
+        try:
+            await coordinator.commands.async_set_max_charging_current(
+                1, rng.randint(6, 16)
+            )
+        except (chuck_rest.ChuckRestTimeout, chuck_rest.ChuckRestError):
+            failed += 1
+            return
+        sent.append(time.monotonic() - started_at)
+
+    targets = [coordinators[n % len(coordinators)] for n in range(commands)]
+    for batch_start in range(0, len(targets), len(coordinators)):
+        await asyncio.gather(
+            *(command(c) for c in targets[batch_start : batch_start + len(coordinators)])
+        )
+    # Confirmation waits for the next status update of each chargebox.
+    for coordinator in coordinators:
+        queue = coordinator.commands.queue
+        deadline = time.monotonic() + 30
+        while queue._confirming and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        confirmed.extend(
+            command.done_at - command.sent_at
+            for command in queue.recent
+            if command.state == STATE_CONFIRMED
+        )
+    return {
+        "failed": failed,
+        "request_to_sent": summarize(sent),
+        "sent_to_confirmed": summarize(confirmed),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    simulator = None
+    if args.url:
+        urls = [f"{args.url.rstrip('/')}/box/{n}" for n in range(1, args.boxes + 1)]
+    else:
+        simulator = simulator_from_args(args)
+        urls = await simulator.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await hass.async_start()
+        results: dict[str, Any] = {"boxes": len(urls)}
+        try:
+            results["poll_throughput"] = await bench_poll_throughput(
+                hass, urls, args.duration
+            )
+            fleet = ChuckFleet(hass)
+            coordinators = await start_coordinators(
+                hass, fleet, urls, args.interval, args.entities
+            )
+            results["loop_lag"] = await bench_loop_lag(args.duration)
+            results["command_rtt"] = await bench_command_rtt(
+                coordinators, args.commands
+            )
+            for n, coordinator in enumerate(coordinators):
+                fleet.async_remove(str(n))
+                await coordinator.async_shutdown()
+                await coordinator.commands.async_shutdown()
+                await coordinator.chargebox.close()
+        finally:
+            await hass.async_stop()
+            if simulator is not None:
+                results["simulator"] = {
+                    "requests": simulator.requests,
+                    "failures": simulator.failures,
+                }
+                await simulator.stop()
+    return results
+
+
+def print_results(results: dict[str, Any], prefix: str = "") -> None:
+    for key, value in results.items():
+        if isinstance(value, dict):
+            print(f"{prefix}{key}:")
+            print_results(value, prefix + "  ")
+        else:
+            print(f"{prefix}{key}: {value}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    parser.add_argument("--url", help="base URL of a running simulator")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per phase")
+    parser.add_argument("--interval", type=int, default=2, help="poll interval in s")
+    parser.add_argument("--entities", type=int, default=30, help="listeners per box")
+    parser.add_argument("--commands", type=int, default=100, help="commands to send")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+    results = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results)
+
+
+if __name__ == "__main__":
+    main()
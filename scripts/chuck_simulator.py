@@ -0,0 +1,440 @@
+"""Offline simulator of the Chuck chargebox HTTP API.
+
+Serves any number of virtual chargeboxes from one aiohttp server, box N under
+http://HOST:PORT/box/N, with the endpoints the integration uses:
+
+    GET  /api/admin/automation/status         connector snapshots
+    GET  /api/admin/automation/status/stream  the same as server-sent events
+    GET  /api/admin/automation/info           device info and unit config
+    GET  /api/status                          basic status
+    POST /api/status                          enable or disable a connector
+    POST /api/transaction                     start or stop a transaction
+    POST /api/admin/unitconfig                write MaxCurrent_N
+
+Cars arrive and leave at random, charge at the connector limit up to 80 % state
+of charge and taper off above it. Simulated time runs --speed times faster than
+wall time. Every request waits --latency +- --jitter seconds, and a
+--failure-rate share of them fails with a 500, a dropped connection or a stall.
+With --etag the status carries an ETag and an unchanged one is answered with
+304 Not Modified, without it the client has to compare bodies.
+
+    python scripts/chuck_simulator.py --boxes 200 --speed 60 --failure-rate 0.01
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import math
+import random
+import time
+from typing import Any
+
+from aiohttp import web
+
+_LOGGER = logging.getLogger(__name__)
+
+NOMINAL_VOLTAGE = 230.0
+MIN_CHARGING_CURRENT = 6
+# Mean time between two cars arriving at a free connector, in simulated seconds.
+ARRIVAL_INTERVAL = 4 * 3600
+# Cars stay between these many simulated seconds unless they are full earlier.
+STAY_TIME = (1800, 10 * 3600)
+# State of charge above which the car lowers its current.
+TAPER_SOC = 0.8
+# Longest simulated time advanced in one step.
+MAX_STEP = 10.0
+DEFAULT_CONFIG = {"MaxDefaultCurrent": 32, "MaxCurrentNet": 40}
+
+
+class SimulatedCar:
+    """Battery taking current up to its own limit, less once nearly full."""
+
+    def __init__(self, rng: random.Random, now: float) -> None:
+        self.capacity_wh = rng.uniform(40, 90) * 1000
+        self.soc = rng.uniform(0.1, 0.7)
+        self.phases = 1 if rng.random() < 0.2 else 3
+        self.max_current = rng.choice((16, 16, 32))
+        self.leaves_at = now + rng.uniform(*STAY_TIME)
+
+    def accepted_current(self, offered: float) -> float:
+        current = min(offered, self.max_current)
+        if self.soc > TAPER_SOC:
+            current = min(current, self.max_current * (1 - self.soc) / (1 - TAPER_SOC))
+        return current if current >= MIN_CHARGING_CURRENT else 0.0
+
+
+class SimulatedConnector:
+    def __init__(self, connector_id: int, rng: random.Random) -> None:
+        self.connector_id = connector_id
+        self.rng = rng
+        self.enabled = True
+        self.max_current = 16.0
+        self.car: SimulatedCar | None = None
+        self.transaction = False
+        self.current = 0.0
+        self.voltage = NOMINAL_VOLTAGE
+        self.total_wh = rng.randint(0, 5_000_000)
+        self.actual_wh = 0
+        self._energy = 0.0
+
+    def step(self, now: float, dt: float) -> None:
+        if self.car is None:
+            if self.rng.random() < dt / ARRIVAL_INTERVAL:
+                self.car = SimulatedCar(self.rng, now)
+                self.transaction = True
+                self.actual_wh = 0
+                self._energy = 0.0
+        elif now >= self.car.leaves_at:
+            self.car = None
+            self.transaction = False
+        self.voltage = NOMINAL_VOLTAGE + self.rng.uniform(-3, 3)
+        if self.car is None or not self.enabled or not self.transaction:
+            self.current = 0.0
+            return
+        self.current = self.car.accepted_current(self.max_current)
+        energy = self.current * self.voltage * self.car.phases * dt / 3600
+        self._energy += energy
+        self.car.soc = min(self.car.soc + energy / self.car.capacity_wh, 1.0)
+        whole = int(self._energy)
+        self.total_wh += whole - self.actual_wh
+        self.actual_wh = whole
+
+    def phase_currents(self) -> tuple[float, float, float]:
+        if self.car is None or not self.current:
+            return (0.0, 0.0, 0.0)
+        if self.car.phases == 1:
+            return (self.current, 0.0, 0.0)
+        return (self.current,) * 3
+
+    @property
+    def charging_status(self) -> str:
+        if self.current:
+            return "CHARGING"
+        if self.car is not None:
+            return "SUSPENDED"
+        return "IDLE"
+
+    def as_status(self, ext: dict[str, float]) -> dict[str, Any]:
+        return {
+            "status": "Enabled" if self.enabled else "Unavailable",
+            "voltage": round(self.voltage, 1),
+            "current": round(self.current, 2),
+            "carConnected": self.car is not None,
+            "packet": {
+                "totalWh": self.total_wh,
+                "actualWh": self.actual_wh,
+                "chargingStatus": self.charging_status,
+                "lockStatus": "LOCKED" if self.car is not None else "UNLOCKED",
+                "internalTemperature": round(25 + self.current * 0.5, 1),
+                "warnings": [],
+                "errors": [],
+                "ext": ext,
+            },
+        }
+
+
+class SimulatedChargebox:
+    """One virtual chargebox, advanced to the current simulated time on every request."""
+
+    def __init__(
+        self, serial: str, connectors: int, rng: random.Random, speed: float
+    ) -> None:
+        self.serial = serial
+        self.rng = rng
+        self.speed = speed
+        self.connectors = {
+            connector_id: SimulatedConnector(connector_id, rng)
+            for connector_id in range(1, connectors + 1)
+        }
+        self.config: dict[str, Any] = dict(DEFAULT_CONFIG)
+        for connector in self.connectors.values():
+            self.config[f"MaxCurrent_{connector.connector_id}"] = str(
+                int(connector.max_current)
+            )
+        self.auth_tag: str | None = None
+        self.base_load = [rng.uniform(1, 8) for _ in range(3)]
+        self.started_at = time.monotonic()
+        self.sim_time = 0.0
+        self._advanced_at = self.started_at
+
+    def advance(self) -> None:
+        now = time.monotonic()
+        remaining = (now - self._advanced_at) * self.speed
+        self._advanced_at = now
+        while remaining > 0:
+            dt = min(remaining, MAX_STEP)
+            self.sim_time += dt
+            for connector in self.connectors.values():
+                connector.step(self.sim_time, dt)
+            remaining -= dt
+        if not any(c.transaction for c in self.connectors.values()):
+            self.auth_tag = None
+
+    def net_currents(self) -> list[float]:
+        # Household load follows the day, simulated time starts at midnight.
+        day = math.sin(2 * math.pi * (self.sim_time % 86400) / 86400 - math.pi / 2)
+        net = [load * (1.5 + day) + self.rng.uniform(-0.3, 0.3) for load in self.base_load]
+        for connector in self.connectors.values():
+            for phase, current in enumerate(connector.phase_currents()):
+                net[phase] += current
+        return [round(max(current, 0.0), 2) for current in net]
+
+    def status(self) -> dict[str, Any]:
+        self.advance()
+        net = self.net_currents()
+        connectors = {}
+        for connector_id, connector in self.connectors.items():
+            ext = {
+                f"crrntl{L}": round(current, 2)
+                for L, current in enumerate(connector.phase_currents(), start=1)
+            }
+            if connector_id == 1:
+                ext.update({f"exmcl{L}": net[L - 1] for L in (1, 2, 3)})
+            connectors[str(connector_id)] = connector.as_status(ext)
+        return {"authTag": self.auth_tag, "connectors": connectors}
+
+    def basic_status(self) -> dict[str, Any]:
+        self.advance()
+        return {
+            "serialNumber": self.serial,
+            "uptime": round(time.monotonic() - self.started_at),
+            "connectors": {
+                str(connector_id): {
+                    "enabled": connector.enabled,
+                    "carConnected": connector.car is not None,
+                }
+                for connector_id, connector in self.connectors.items()
+            },
+        }
+
+    def info(self) -> dict[str, Any]:
+        return {
+            "vendor": "TeepCo",
+            "model": "Chuck",
+            "serialNumber": self.serial,
+            "firmwareVersion": "simulator",
+            "config": dict(self.config),
+        }
+
+    def write_unit_config(self, values: dict[str, Any]) -> None:
+        self.advance()
+        for key, value in values.items():
+            self.config[key] = value
+            if key.startswith("MaxCurrent_"):
+                connector = self.connectors.get(int(key.removeprefix("MaxCurrent_")))
+                if connector is not None:
+                    connector.max_current = float(value)
+
+    def set_enabled(self, connector_id: int, enabled: bool) -> None:
+        self.advance()
+        self.connectors[connector_id].enabled = enabled
+
+    def transaction(self, connector_id: int, action: str) -> None:
+        self.advance()
+        connector = self.connectors[connector_id]
+        if action == "stop":
+            connector.transaction = False
+        elif connector.car is not None:
+            connector.transaction = True
+            self.auth_tag = f"SIM{self.rng.randrange(16**6):06X}"
+
+
+class ChuckSimulator:
+    """aiohttp application serving a number of simulated chargeboxes."""
+
+    def __init__(
+        self,
+        boxes: int = 1,
+        connectors: int = 2,
+        speed: float = 1.0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        stall: float = 30.0,
+        auth: tuple[str, str] | None = ("admin", "admin"),
+        stream_interval: float = 2.0,
+        etag: bool = False,
+        seed: int | None = None,
+    ) -> None:
+        self.rng = random.Random(seed)
+        self.boxes = {
+            str(n): SimulatedChargebox(
+                f"SIM{n:06d}", connectors, random.Random(self.rng.random()), speed
+            )
+            for n in range(1, boxes + 1)
+        }
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.stall = stall
+        self.stream_interval = stream_interval
+        self.etag = etag
+        self.auth_header = (
+            None
+            if auth is None
+            else "Basic " + base64.b64encode(":".join(auth).encode()).decode()
+        )
+        self.requests = 0
+        self.failures = 0
+        self._runner: web.AppRunner | None = None
+        self.base_url: str | None = None
+
+    def make_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/box/{box}/api/admin/automation/status", self._status)
+        app.router.add_get("/box/{box}/api/admin/automation/status/stream", self._stream)
+        app.router.add_get("/box/{box}/api/admin/automation/info", self._info)
+        app.router.add_get("/box/{box}/api/status", self._basic_status)
+        app.router.add_post("/box/{box}/api/status", self._enable)
+        app.router.add_post("/box/{box}/api/transaction", self._transaction)
+        app.router.add_post("/box/{box}/api/admin/unitconfig", self._unit_config)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> list[str]:
+        """Serve the boxes and return their base URLs."""
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{port}"
+        return [f"{self.base_url}/box/{box}" for box in self.boxes]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        self.requests += 1
+        if request.match_info.get("box") not in self.boxes:
+            raise web.HTTPNotFound()
+        if self.auth_header is not None and request.headers.get("Authorization") != self.auth_header:
+            raise web.HTTPUnauthorized()
+        if self.latency or self.jitter:
+            await asyncio.sleep(max(self.latency + self.rng.uniform(-1, 1) * self.jitter, 0))
+        if self.rng.random() < self.failure_rate:
+            self.failures += 1
+            failure = self.rng.choice(("error", "drop", "stall"))
+            if failure == "error":
+                raise web.HTTPInternalServerError()
+            if failure == "drop":
+                request.transport.close()
+                raise web.HTTPInternalServerError()
+            await asyncio.sleep(self.stall)
+        return await handler(request)
+
+    def _box(self, request: web.Request) -> SimulatedChargebox:
+        return self.boxes[request.match_info["box"]]
+
+    async def _status(self, request: web.Request) -> web.Response:
+        if not self.etag:
+            return web.json_response(self._box(request).status())
+        body = json.dumps(self._box(request).status())
+        etag = f'"{hashlib.sha1(body.encode()).hexdigest()[:16]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(
+            text=body, content_type="application/json", headers={"ETag": etag}
+        )
+
+    async def _stream(self, request: web.Request) -> web.StreamResponse:
+        box = self._box(request)
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        while True:
+            await response.write(f"data: {json.dumps(box.status())}\n\n".encode())
+            await asyncio.sleep(self.stream_interval)
+
+    async def _info(self, request: web.Request) -> web.Response:
+        return web.json_response(self._box(request).info())
+
+    async def _basic_status(self, request: web.Request) -> web.Response:
+        return web.json_response(self._box(request).basic_status())
+
+    async def _enable(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        try:
+            self._box(request).set_enabled(int(body["connectorId"]), bool(body["enable"]))
+        except (KeyError, ValueError):
+            raise web.HTTPBadRequest()
+        return web.json_response({})
+
+    async def _transaction(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        try:
+            self._box(request).transaction(int(body["connector"]), body["action"])
+        except (KeyError, ValueError):
+            raise web.HTTPBadRequest()
+        return web.json_response({})
+
+    async def _unit_config(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        if not isinstance(body.get("values"), dict):
+            raise web.HTTPBadRequest()
+        self._box(request).write_unit_config(body["values"])
+        return web.json_response({})
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--boxes", type=int, default=1, help="number of chargeboxes")
+    parser.add_argument("--connectors", type=int, default=2, help="connectors per box")
+    parser.add_argument("--speed", type=float, default=1.0, help="simulated seconds per second")
+    parser.add_argument("--latency", type=float, default=0.0, help="response delay in s")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+- spread of the delay in s")
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.0, help="share of failing requests"
+    )
+    parser.add_argument("--stall", type=float, default=30.0, help="length of a stall in s")
+    parser.add_argument(
+        "--etag", action="store_true", help="answer unchanged status polls with 304"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+
+
+def simulator_from_args(args: argparse.Namespace) -> ChuckSimulator:
+    return ChuckSimulator(
+        boxes=args.boxes,
+        connectors=args.connectors,
+        speed=args.speed,
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        stall=args.stall,
+        etag=args.etag,
+        auth=None if getattr(args, "no_auth", False) else ("admin", "admin"),
+        seed=args.seed,
+    )
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    simulator = simulator_from_args(args)
+    urls = await simulator.start(args.host, args.port)
+    print(f"Serving {len(urls)} chargeboxes, e.g. {urls[0]}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--no-auth", action="store_true", help="accept any credentials")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()